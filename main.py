@@ -2,12 +2,11 @@
 """
 TwitchDropsMiner - Main entry point
 
-This is a simple launcher that runs the src package as a module.
+This is a simple launcher that runs the application's entry point.
 All application code is in the src/ directory.
 """
 
 if __name__ == "__main__":
-    import runpy
+    from src.__main__ import run
 
-    # Run the src package as a module
-    runpy.run_module("src", run_name="__main__")
+    run()
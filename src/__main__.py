@@ -1,25 +1,28 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
 import signal
 import sys
 import traceback
 import warnings
-from logging.handlers import TimedRotatingFileHandler
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from queue import SimpleQueue
 
-import truststore
 
+def run() -> None:
+    """Set up logging and settings, then run the miner until it exits."""
+    import truststore
 
-if __name__ == "__main__":
+    # NOTE: This has to happen before aiohttp is imported anywhere,
+    # as it creates its default SSL context at import time
     truststore.inject_into_ssl()
 
     from src.config import FILE_FORMATTER
     from src.config.settings import Settings
-    from src.core.client import Twitch
-    from src.exceptions import CaptchaRequired
-    from src.i18n import _
     from src.version import __version__
 
     logger = logging.getLogger("TwitchDrops")
@@ -38,13 +41,21 @@ if __name__ == "__main__":
     # Add file handler for timestamped log
     file_handler = TimedRotatingFileHandler(log_file, when="midnight", backupCount=5)
     file_handler.setFormatter(FILE_FORMATTER)
-    logger.addHandler(file_handler)
-
-    logger.info("Logger initialized")
+    # NOTE: The file writes and the midnight rollover happen on the listener's thread,
+    # so that logging only costs a queue put on the event loop.
+    # At exit, the listener is stopped first (writing out whatever is still queued),
+    # then the file is closed. uvicorn's logging setup drops the file handler from logging's
+    # own shutdown list, so it has to be closed explicitly.
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    log_listener.start()
+    # atexit calls these in reverse order of registration
+    atexit.register(file_handler.close)
+    atexit.register(log_listener.stop)
 
     warnings.simplefilter("default", ResourceWarning)
 
-    logger.debug("Loading settings")
     try:
         settings = Settings()
     except Exception:
@@ -54,88 +65,82 @@ if __name__ == "__main__":
 
     # client run
     async def main():
+        # NOTE: The client and web stacks are imported only once settings loaded successfully,
+        # so that an early exit doesn't pay for importing them
+        from src.core.client import Twitch
+        from src.exceptions import CaptchaRequired
+        from src.i18n import _
+        from src.web import app as webapp
+        from src.web.gui_manager import WebGUIManager
+
         # set language
         if settings.language:
             _.set_language(settings.language)
 
         logger.info("=== TwitchDropsMiner Starting ===")
-        logger.info(f"Version: {__version__}")
-        logger.info(f"Python version: {sys.version}")
-        logger.info(f"Platform: {sys.platform}")
-        logger.info(f"Proxy: {settings.proxy}")
-        logger.info(f"Language: {settings.language}")
+        logger.info("Version: %s", __version__)
+        logger.info("Python version: %s", sys.version)
+        logger.info("Platform: %s", sys.platform)
+        logger.info("Proxy: %s", settings.proxy)
+        logger.info("Language: %s", settings.language)
         logger.info(
-            f"Minimum refresh interval: {settings.minimum_refresh_interval_minutes} minutes"
+            "Minimum refresh interval: %d minutes", settings.minimum_refresh_interval_minutes
         )
 
         exit_status = 0
         client = Twitch(settings)
 
-        # Initialize web GUI
-        from src.web import app as webapp
-        from src.web.gui_manager import WebGUIManager
-
         # Set up web GUI
         client.gui = WebGUIManager(client)
         # Set up webapp references
         webapp.set_managers(client.gui, client)
-        # Start web server in background
-        logger.info("Starting web server on http://0.0.0.0:8080")
-        web_server_task = asyncio.create_task(webapp.run_server(host="0.0.0.0", port=8080))
 
         loop = asyncio.get_running_loop()
         if sys.platform == "linux":
-            logger.debug("Setting up signal handlers for SIGINT and SIGTERM")
-            loop.add_signal_handler(signal.SIGINT, lambda *_: client.close())
-            loop.add_signal_handler(signal.SIGTERM, lambda *_: client.close())
-
-        logger.info("Starting main client run loop")
+            # NOTE: The loop runs these as regular callbacks, not from the signal handler itself,
+            # and close() only flips the exit state and event, so no watcher task is needed
+            loop.add_signal_handler(signal.SIGINT, client.close)
+            loop.add_signal_handler(signal.SIGTERM, client.close)
+
+        # NOTE: The task group only exits once the web server task has finished,
+        # and cancels the client run if the web server fails. Errors raised by its background
+        # tasks come out as an exception group, and are handled here so that the settings
+        # still get saved below
         try:
-            await client.run()
-            logger.info("Client run completed normally")
-        except CaptchaRequired:
-            logger.error("Captcha required - cannot continue")
-            exit_status = 1
-            client.print(_.t["error"]["captcha"])
-        except Exception:
-            logger.exception("Fatal error encountered during client run")
+            async with asyncio.TaskGroup() as tasks:
+                # Start web server in background
+                logger.info("Starting web server on http://0.0.0.0:8080")
+                tasks.create_task(webapp.run_server(host="0.0.0.0", port=8080))
+                # the GQL connection handshake overlaps with the web server boot and the login
+                tasks.create_task(client.warmup())
+                try:
+                    await client.run()
+                except CaptchaRequired:
+                    logger.error("Captcha required - cannot continue")
+                    exit_status = 1
+                    client.print(_.t["error"]["captcha"])
+                except Exception:
+                    logger.exception("Fatal error encountered during client run")
+                    exit_status = 1
+                    client.print("Fatal error encountered:\n")
+                    client.print(traceback.format_exc())
+                finally:
+                    logger.info("=== Starting shutdown sequence ===")
+                    if sys.platform == "linux":
+                        loop.remove_signal_handler(signal.SIGINT)
+                        loop.remove_signal_handler(signal.SIGTERM)
+                    client.print(_.t["gui"]["status"]["exiting"])
+                    # Trigger a graceful web server shutdown, the task group waits for it to finish
+                    logger.info("Shutting down web server")
+                    await webapp.shutdown_server()
+                    logger.info("Shutting down Twitch client")
+                    await client.shutdown()
+        except* Exception:
+            # the web server or warmup task failed, the client run was cancelled by the group
+            logger.exception("Fatal error encountered in a background task")
             exit_status = 1
             client.print("Fatal error encountered:\n")
             client.print(traceback.format_exc())
-        finally:
-            logger.info("=== Starting shutdown sequence ===")
-            if sys.platform == "linux":
-                logger.debug("Removing signal handlers (Linux)")
-                loop.remove_signal_handler(signal.SIGINT)
-                loop.remove_signal_handler(signal.SIGTERM)
-            logger.info("Notifying client of exit")
-            client.print(_.t["gui"]["status"]["exiting"])
-            # Shutdown web server
-            if web_server_task and not web_server_task.done():
-                logger.info("Shutting down web server")
-                # Trigger graceful shutdown and wait for it to finish
-                await webapp.shutdown_server()
-                # Wait for server to actually exit (with timeout)
-                try:
-                    await asyncio.wait_for(web_server_task, timeout=5.0)
-                    logger.info("Web server task completed gracefully")
-                except asyncio.TimeoutError:
-                    logger.warning("Web server didn't exit in time, forcing cancellation")
-                    web_server_task.cancel()
-                    try:
-                        await web_server_task
-                    except asyncio.CancelledError:
-                        logger.info("Web server task force-cancelled")
-                except Exception as e:
-                    logger.error(f"Error while shutting down web server: {e}")
-            else:
-                logger.debug(
-                    f"Web server task status: task={web_server_task is not None}, done={web_server_task.done() if web_server_task else 'N/A'}"
-                )
-            logger.info("Shutting down Twitch client")
-            await client.shutdown()
-            logger.info("Twitch client shutdown completed")
-        logger.info(f"Shutdown complete - exit_status={exit_status}")
         if exit_status != 0:
             logger.warning("Application terminated with error - showing error state")
             # Application terminated with error
@@ -144,14 +149,25 @@ if __name__ == "__main__":
             # notify the user about the closure
             client.gui.grab_attention(sound=True)
             # Web GUI doesn't need to wait - browser clients can stay connected
-            logger.info("Web GUI - no need to wait for user to close browser")
-        else:
-            logger.info("Normal shutdown - proceeding")
         # save the application state
-        logger.info("Saving application state")
         settings.save()
-        logger.info("Application state saved")
-        logger.info(f"=== Exiting with status code: {exit_status} ===")
+        logger.info("=== Exiting with status code: %d ===", exit_status)
         sys.exit(exit_status)
 
-    asyncio.run(main())
+    # NOTE: uvloop comes with uvicorn[standard] outside of Windows, and is used when available
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None
+    try:
+        if sys.platform == "win32":
+            import winloop as uvloop  # type: ignore[import-not-found]
+        else:
+            import uvloop
+    except ImportError:
+        pass
+    else:
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
+
+
+if __name__ == "__main__":
+    run()
@@ -7,11 +7,29 @@ with Twitch's API endpoints.
 
 from __future__ import annotations
 
-from src.api.gql_client import GQLClient
-from src.api.http_client import HTTPClient
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from src.api.gql_client import GQLClient
+    from src.api.http_client import HTTPClient
 
 
 __all__ = [
     "HTTPClient",
     "GQLClient",
 ]
+
+
+def __getattr__(name: str):
+    # NOTE: The clients are imported on first access, so that importing one of them
+    # (or just a submodule) doesn't pull in the other one, and aiohttp along with it
+    if name == "HTTPClient":
+        from src.api.http_client import HTTPClient
+
+        return HTTPClient
+    if name == "GQLClient":
+        from src.api.gql_client import GQLClient
+
+        return GQLClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
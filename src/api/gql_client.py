@@ -6,11 +6,12 @@ Handles GraphQL requests with rate limiting, error handling, and retry logic.
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from itertools import chain
+from enum import Enum, auto
 from typing import TYPE_CHECKING, overload
 
+import orjson
+
 from src.exceptions import GQLException, MinerException
 from src.utils import ExponentialBackoff, RateLimiter
 
@@ -23,6 +24,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("TwitchDrops")
 gql_logger = logging.getLogger("TwitchDrops.gql")
+_MISSING = object()
+GQL_URL = "https://gql.twitch.tv/gql"
+
+
+class _ErrorAction(Enum):
+    """How a GQL response error message is handled."""
+
+    SINGLE_RETRY = auto()  # retry the request once, with a minimum delay
+    NULLIFY = auto()  # nullify the data key the error path points to
+    FORCE_RETRY = auto()  # retry the request after the backoff delay
+
+
+# error messages that can be handled, any other error raises a GQLException
+_ERROR_ACTIONS: dict[str, _ErrorAction] = {
+    "service error": _ErrorAction.SINGLE_RETRY,
+    "PersistedQueryNotFound": _ErrorAction.SINGLE_RETRY,
+    "server error": _ErrorAction.NULLIFY,
+    "service timeout": _ErrorAction.FORCE_RETRY,
+    "service unavailable": _ErrorAction.FORCE_RETRY,
+    "context deadline exceeded": _ErrorAction.FORCE_RETRY,
+}
 
 
 class GQLClient:
@@ -62,6 +84,10 @@ class GQLClient:
         # Do not modify these safe defaults.
         self._qgl_limiter = RateLimiter(capacity=5, window=1)
 
+    async def warmup(self) -> None:
+        """Open a connection to the GQL endpoint ahead of the first request."""
+        await self.http_client.warmup(GQL_URL)
+
     @overload
     async def request(self, ops: GQLRequest) -> JsonType: ...
 
@@ -86,85 +112,116 @@ class GQLClient:
         ------
         GQLException
             If the GQL API returns an error that can't be handled
-        RuntimeError
-            If the retry loop is broken unexpectedly
         """
-        gql_logger.debug(f"GQL Request: {ops}")
-        backoff = ExponentialBackoff(maximum=60)
+        gql_logger.debug("GQL Request: %s", ops)
+        # NOTE: the backoff is only created once a retry is actually needed
+        backoff: ExponentialBackoff | None = None
         # Flag to retry the request once for specific errors
         single_retry: bool = True
+        # Flag to retry the request once with a revalidated access token
+        token_retry: bool = True
+        # NOTE: GQL payloads can be large, so both directions go through orjson,
+        # and the request body is encoded only once for all retries
+        request_data: bytes = orjson.dumps(ops)
 
-        for delay in backoff:
+        while True:
             async with self._qgl_limiter:
                 auth_state = await self._auth_state.validate()
                 async with self.http_client.request(
                     "POST",
-                    "https://gql.twitch.tv/gql",
-                    json=ops,
+                    GQL_URL,
+                    data=request_data,
                     headers=auth_state.headers(user_agent=self._client_type.USER_AGENT, gql=True),
                 ) as response:
-                    response_json: JsonType | list[JsonType] = await response.json()
-
-            gql_logger.debug(f"GQL Response: {response_json}")
-            orig_response = response_json
-
-            # Normalize to list for unified error handling
-            response_list = response_json if isinstance(response_json, list) else [response_json]
-
-            force_retry: bool = False
-            for response_json in response_list:
-                # GQL error handling
-                if "errors" in response_json:
-                    for error_dict in response_json["errors"]:
-                        if "message" in error_dict:
-                            if single_retry and error_dict["message"] in (
-                                "service error",
-                                "PersistedQueryNotFound",
-                            ):
-                                logger.error(
-                                    f"Retrying a {error_dict['message']} for "
-                                    f"{response_json['extensions']['operationName']}"
-                                )
-                                single_retry = False
-                                if delay < 5:
-                                    # Overwrite delay if too short
-                                    delay = 5
-                                force_retry = True
-                                break
-                            elif error_dict["message"] == "server error":
-                                # Nullify the key the error path points to
-                                data_dict: JsonType = response_json["data"]
-                                path: list[str] = error_dict.get("path", [])
-                                for key in path[:-1]:
-                                    data_dict = data_dict[key]
-                                data_dict[path[-1]] = None
-                                break
-                            elif error_dict["message"] in (
-                                "service timeout",
-                                "service unavailable",
-                                "context deadline exceeded",
-                            ):
-                                force_retry = True
-                                break
-                    else:
-                        raise GQLException(response_json["errors"])
-                # Other error handling
-                elif "error" in response_json:
-                    raise GQLException(f"{response_json['error']}: {response_json['message']}")
-
-                if force_retry:
-                    break
+                    if response.status == 401 and token_retry:
+                        # the access token has been revoked since it was last validated
+                        logger.info("GQL access token rejected, revalidating")
+                        token_retry = False
+                        auth_state.invalidate()
+                        continue
+                    response_json: JsonType | list[JsonType] = await response.json(
+                        loads=orjson.loads
+                    )
+
+            gql_logger.debug("GQL Response: %s", response_json)
+
+            # NOTE: single operations (the majority) are checked directly, without a list wrap
+            action: _ErrorAction | None = None
+            if isinstance(response_json, list):
+                for op_response in response_json:
+                    action = self._check_response(op_response, single_retry=single_retry)
+                    if action is not None:
+                        break
             else:
-                return orig_response
+                action = self._check_response(response_json, single_retry=single_retry)
+            if action is None:
+                return response_json
+            if backoff is None:
+                backoff = ExponentialBackoff(maximum=60)
+            delay = next(backoff)
+            if action is _ErrorAction.SINGLE_RETRY:
+                single_retry = False
+                if delay < 5:
+                    # Overwrite delay if too short
+                    delay = 5
+
+            await self.http_client.backoff_sleep(delay)
+
+    @staticmethod
+    def _check_response(response_json: JsonType, *, single_retry: bool) -> _ErrorAction | None:
+        """
+        Handle the errors of a single operation's response.
 
-            await asyncio.sleep(delay)
+        Parameters
+        ----------
+        response_json : JsonType
+            Response of a single operation. Errors that can be handled in place
+            are applied to its data.
+        single_retry : bool
+            Whether the single retry for specific errors is still available
 
-        raise RuntimeError("Retry loop was broken")
+        Returns
+        -------
+        _ErrorAction | None
+            The retry action the request needs, or None if the response can be used
+
+        Raises
+        ------
+        GQLException
+            If the response contains an error that can't be handled
+        """
+        # GQL error handling
+        if "errors" in response_json:
+            for error_dict in response_json["errors"]:
+                action = _ERROR_ACTIONS.get(error_dict.get("message"))
+                if action is _ErrorAction.SINGLE_RETRY:
+                    if not single_retry:
+                        continue
+                    logger.error(
+                        f"Retrying a {error_dict['message']} for "
+                        f"{response_json['extensions']['operationName']}"
+                    )
+                    return action
+                elif action is _ErrorAction.NULLIFY:
+                    # Nullify the key the error path points to
+                    data_dict: JsonType = response_json["data"]
+                    path: list[str] = error_dict.get("path", [])
+                    for key in path[:-1]:
+                        data_dict = data_dict[key]
+                    data_dict[path[-1]] = None
+                    return None
+                elif action is _ErrorAction.FORCE_RETRY:
+                    return action
+            raise GQLException(response_json["errors"])
+        # Other error handling
+        elif "error" in response_json:
+            raise GQLException(f"{response_json['error']}: {response_json['message']}")
+        return None
 
     @staticmethod
     def merge_data(primary_data: JsonType, secondary_data: JsonType) -> JsonType:
         """
-        Recursively merge two JSON objects, preferring primary data.
+        Deep merge two JSON objects, preferring primary data.
 
         This is used to merge campaign data from inventory and general campaigns endpoints.
 
@@ -185,21 +242,21 @@ class GQLClient:
         MinerException
             If data types are inconsistent between sources
         """
-        merged = {}
-        for key in set(chain(primary_data.keys(), secondary_data.keys())):
-            in_primary = key in primary_data
-            if in_primary and key in secondary_data:
-                vp = primary_data[key]
-                vs = secondary_data[key]
-                if not isinstance(vp, type(vs)) or not isinstance(vs, type(vp)):
+        merged: JsonType = dict(primary_data)
+        # NOTE: nested dicts are merged via an explicit stack of (output, secondary) pairs,
+        # where each output starts as a shallow copy of the primary dict
+        stack: list[tuple[JsonType, JsonType]] = [(merged, secondary_data)]
+        while stack:
+            output, secondary = stack.pop()
+            for key, vs in secondary.items():
+                vp = output.get(key, _MISSING)
+                if vp is _MISSING:
+                    # In secondary only
+                    output[key] = vs
+                elif type(vp) is not type(vs):
                     raise MinerException("Inconsistent merge data")
-                if isinstance(vp, dict):  # Both are dicts
-                    merged[key] = GQLClient.merge_data(vp, vs)
-                else:
-                    # Use primary value
-                    merged[key] = vp
-            elif in_primary:
-                merged[key] = primary_data[key]
-            else:  # In secondary only
-                merged[key] = secondary_data[key]
+                elif isinstance(vp, dict):  # Both are dicts
+                    output[key] = nested = dict(vp)
+                    stack.append((nested, vs))
+                # otherwise, keep the primary value
         return merged
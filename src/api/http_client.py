@@ -10,10 +10,13 @@ import asyncio
 import logging
 from collections import abc
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING
+from copy import copy
+from datetime import datetime
+from time import time
+from typing import TYPE_CHECKING, Literal
 
 import aiohttp
+import orjson
 from yarl import URL
 
 from src.config import COOKIES_PATH
@@ -23,6 +26,8 @@ from src.utils import ExponentialBackoff
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from src.config import ClientInfo
     from src.config.settings import Settings
     from src.core.client import Twitch
@@ -32,6 +37,29 @@ if TYPE_CHECKING:
 logger = logging.getLogger("TwitchDrops")
 
 
+async def save_cookie_jar(cookie_jar: aiohttp.CookieJar, path: Path) -> None:
+    """
+    Save the cookie jar to a file, without blocking the event loop.
+
+    The jar is shared with the running requests, so its cookies are copied on the loop,
+    and only the copy is written out on a worker thread.
+
+    Parameters
+    ----------
+    cookie_jar : aiohttp.CookieJar
+        The cookie jar to save
+    path : Path
+        Path of the file to save the cookies to
+    """
+    # NOTE: aiohttp provides no public way of copying a jar, so the private attributes
+    # its save() method reads are copied over into a detached jar
+    snapshot = aiohttp.CookieJar()
+    snapshot._cookies.update((key, copy(cookie)) for key, cookie in cookie_jar._cookies.items())
+    snapshot._host_only_cookies.update(cookie_jar._host_only_cookies)
+    snapshot._expirations.update(cookie_jar._expirations)
+    await asyncio.to_thread(snapshot.save, path)
+
+
 class HTTPClient:
     """
     Manages HTTP session and handles request retries with exponential backoff.
@@ -69,6 +97,9 @@ class HTTPClient:
         self._twitch = twitch
         self._client_type = client_type
         self._session: aiohttp.ClientSession | None = None
+        self._session_lock = asyncio.Lock()
+        # total session timeout, in seconds
+        self._session_timeout: float = 0.0
 
     async def get_session(self) -> aiohttp.ClientSession:
         """
@@ -84,41 +115,55 @@ class HTTPClient:
         RuntimeError
             If the session is closed
         """
-        if (session := self._session) is not None:
-            if session.closed:
-                raise RuntimeError("Session is closed")
-            return session
-
+        if (session := self._session) is None:
+            # NOTE: creating the session awaits the cookie file read, so concurrent callers
+            # have to wait for the first one, instead of creating sessions of their own
+            async with self._session_lock:
+                if (session := self._session) is None:
+                    session = self._session = await self._create_session()
+        if session.closed:
+            raise RuntimeError("Session is closed")
+        return session
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session, with the cookies loaded from disk."""
         # Load cookies
+        # NOTE: the cookie file is read on a worker thread, to not block the event loop on file I/O.
+        # No request can use the jar before it's loaded, see save_cookie_jar for saving it
         cookie_jar = aiohttp.CookieJar()
         try:
             if COOKIES_PATH.exists():
-                cookie_jar.load(COOKIES_PATH)
+                await asyncio.to_thread(cookie_jar.load, COOKIES_PATH)
         except Exception:
             # If loading cookies fails, clear the jar and continue
             cookie_jar.clear()
 
-        # Create timeouts based on connection quality
+        # Create timeouts based on connection quality, which Settings keeps within 1-6
         connection_quality = self.settings.connection_quality
-        if connection_quality < 1:
-            connection_quality = self.settings.connection_quality = 1
-        elif connection_quality > 6:
-            connection_quality = self.settings.connection_quality = 6
-
         timeout = aiohttp.ClientTimeout(
             sock_connect=5 * connection_quality,
             total=10 * connection_quality,
         )
+        self._session_timeout = timeout.total or 0.0
 
         # Create session with connection pooling
-        connector = aiohttp.TCPConnector(limit=50)
-        self._session = aiohttp.ClientSession(
+        # NOTE: most requests go to a handful of Twitch hosts, so DNS results are cached longer,
+        # idle connections are kept around between the periodic requests,
+        # and a single host can't take up the whole pool
+        connector = aiohttp.TCPConnector(
+            limit=50,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        return aiohttp.ClientSession(
             timeout=timeout,
             connector=connector,
             cookie_jar=cookie_jar,
             headers={"User-Agent": self._client_type.USER_AGENT},
+            # requests made with json= are encoded with orjson instead of the stdlib
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
         )
-        return self._session
 
     @asynccontextmanager
     async def request(
@@ -127,6 +172,7 @@ class HTTPClient:
         url: URL | str,
         *,
         invalidate_after: datetime | None = None,
+        prefetch: bool = True,
         **kwargs,
     ) -> abc.AsyncIterator[aiohttp.ClientResponse]:
         """
@@ -140,6 +186,10 @@ class HTTPClient:
             Request URL
         invalidate_after : datetime | None, optional
             Datetime after which the request should not be retried
+        prefetch : bool, optional
+            Read the whole response body before yielding it, so that any payload errors
+            are retried here, instead of being raised while the caller reads it.
+            Set to False for callers that stream the body from ``response.content``.
         **kwargs
             Additional arguments passed to aiohttp.ClientSession.request
 
@@ -157,59 +207,111 @@ class HTTPClient:
         aiohttp.ClientConnectorCertificateError
             If SSL verification fails
         """
-        session = await self.get_session()
+        # NOTE: the session is only looked up through get_session until it's ready for use
+        session = self._session
+        if session is None or session.closed:
+            session = await self.get_session()
         method = method.upper()
 
         if self.settings.proxy and "proxy" not in kwargs:
             kwargs["proxy"] = self.settings.proxy
 
-        logger.debug(f"Request: ({method=}, {url=}, {kwargs=})")
-        session_timeout = timedelta(seconds=session.timeout.total or 0)
-        backoff = ExponentialBackoff(maximum=3 * 60)
-
-        for delay in backoff:
-            from src.config import State
-
-            if self._twitch._state == State.EXIT:
+        logger.debug("Request: (method=%r, url=%r, kwargs=%r)", method, url, kwargs)
+        # timestamp after which the request is invalid,
+        # accounting for expiration landing during the request
+        invalidate_at: float | None = None
+        if invalidate_after is not None:
+            invalidate_at = invalidate_after.timestamp() - self._session_timeout
+        # NOTE: the backoff is only created once a retry is actually needed
+        backoff: ExponentialBackoff | None = None
+        while True:
+            if self._twitch._exit_event.is_set():
                 raise ExitRequest()
-            elif (
-                invalidate_after is not None
-                # Account for expiration landing during the request
-                and datetime.now(timezone.utc) >= (invalidate_after - session_timeout)
-            ):
+            elif invalidate_at is not None and time() >= invalidate_at:
                 raise RequestInvalid()
 
             try:
                 response: aiohttp.ClientResponse | None = None
                 response = await session.request(method, url, **kwargs)
                 assert response is not None
-                logger.debug(f"Response: {response.status}: {response}")
-
-                if response.status < 500:
-                    # Pre-read the response to avoid getting errors outside the context manager
-                    raw_response = await response.read()  # noqa: F841
-                    yield response
-                    return
+                logger.debug("Response: %s: %s", response.status, response)
 
-                self.gui.print(_.t["error"]["site_down"].format(seconds=round(delay)))
+                if prefetch and response.status < 500:
+                    # Pre-read the response, so that payload errors are retried here,
+                    # instead of being raised while the caller reads it
+                    await response.read()
             except aiohttp.ClientConnectorCertificateError:
                 # SSL verification failures should not be retried
                 raise
-            except (
-                aiohttp.ClientConnectionError,
-                asyncio.TimeoutError,
-                aiohttp.ClientPayloadError,
-            ):
+            except (TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError):
                 # Connection problems, retry with backoff
-                if backoff.steps > 1:
-                    # Don't show quick retries to the user
-                    self.gui.print(_.t["error"]["no_connection"].format(seconds=round(delay)))
+                error_key: Literal["site_down", "no_connection"] = "no_connection"
+            else:
+                # NOTE: the response is yielded outside of the retried section,
+                # so that errors raised by the caller propagate as they are
+                if response.status < 500:
+                    yield response
+                    return
+                error_key = "site_down"
             finally:
                 if response is not None:
                     response.release()
 
-            # Wait for the backoff delay
-            await asyncio.sleep(delay)
+            if backoff is None:
+                backoff = ExponentialBackoff(maximum=3 * 60)
+            delay = next(backoff)
+            # Don't show quick connection retries to the user
+            if error_key == "site_down" or backoff.steps > 1:
+                self.gui.print(_.t["error"][error_key].format(seconds=round(delay)))
+            await self.backoff_sleep(delay)
+
+    async def warmup(self, *urls: URL | str) -> None:
+        """
+        Open connections to the given URLs ahead of time, to be reused by the first requests.
+
+        This is a best effort: requests aren't retried, and failures are ignored.
+
+        Parameters
+        ----------
+        *urls : URL | str
+            URLs to connect to
+        """
+        try:
+            session = await self.get_session()
+        except Exception as exc:
+            logger.debug("Connection warm-up failed: %r", exc)
+            return
+        proxy = self.settings.proxy or None
+
+        async def connect(url: URL | str) -> None:
+            try:
+                async with session.head(url, proxy=proxy):
+                    pass
+            except Exception as exc:
+                logger.debug("Connection warm-up for %s failed: %r", url, exc)
+
+        await asyncio.gather(*(connect(url) for url in urls))
+
+    async def backoff_sleep(self, delay: float) -> None:
+        """
+        Wait for a retry backoff delay, waking up early if the application is closing.
+
+        Parameters
+        ----------
+        delay : float
+            The backoff delay, in seconds
+
+        Raises
+        ------
+        ExitRequest
+            If the application has been requested to close during the wait
+        """
+        try:
+            async with asyncio.timeout(delay):
+                await self._twitch._exit_event.wait()
+        except TimeoutError:
+            return
+        raise ExitRequest()
 
     async def close(self) -> None:
         """
@@ -223,11 +325,12 @@ class HTTPClient:
 
             # Clear empty cookie entries before saving
             # NOTE: Unfortunately, aiohttp provides no easy way of clearing empty cookies,
-            # so we need to access the private '_cookies' attribute
-            for cookie_key, cookie in list(cookie_jar._cookies.items()):
-                if not cookie:
-                    del cookie_jar._cookies[cookie_key]
+            # so we need to access the private '_cookies' attribute. It's a defaultdict,
+            # so it's pruned in place (only snapshotting the empty keys) rather than rebuilt.
+            cookies = cookie_jar._cookies
+            for cookie_key in [key for key, cookie in cookies.items() if not cookie]:
+                del cookies[cookie_key]
 
-            cookie_jar.save(COOKIES_PATH)
+            await save_cookie_jar(cookie_jar, COOKIES_PATH)
             await self._session.close()
             self._session = None
@@ -4,17 +4,28 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, cast
+import os
+import secrets
+from datetime import UTC, datetime, timedelta
+from time import monotonic, time
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import aiohttp
+import orjson
+from multidict import CIMultiDict
 from yarl import URL
 
-from src.config import COOKIES_PATH
+from src.api.http_client import save_cookie_jar
+from src.config import AUTH_STATE_PATH, COOKIES_PATH
+from src.exceptions import RequestInvalid
 from src.i18n import _
-from src.utils import CHARS_HEX_LOWER, create_nonce
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from http.cookies import BaseCookie
+
     from src.config import ClientInfo, JsonType
     from src.core.client import Twitch
     from src.web.gui_manager import LoginForm
@@ -22,6 +33,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("TwitchDrops")
 
+# flags for the optional authentication state attributes, set while an attribute holds a value
+_USER_ID = 1
+_DEVICE_ID = 2
+_SESSION_ID = 4
+_ACCESS_TOKEN = 8
+_CLIENT_VERSION = 16
+_ATTR_NAMES: dict[int, tuple[str, ...]] = {
+    _USER_ID: ("user_id",),
+    _DEVICE_ID: ("device_id",),
+    _SESSION_ID: ("session_id",),
+    _ACCESS_TOKEN: ("access_token", "_auth_header"),
+    _CLIENT_VERSION: ("client_version",),
+}
+_LOGGED_IN = _USER_ID | _DEVICE_ID | _SESSION_ID | _ACCESS_TOKEN
+# Twitch requires apps to validate their access tokens once an hour
+_VALIDATION_TTL = 3600
+
 
 class _AuthState:
     """
@@ -34,35 +62,156 @@ class _AuthState:
     - Cookie persistence
     """
 
+    __slots__ = (
+        "_twitch",
+        "_lock",
+        "_logged_in",
+        "_headers_cache",
+        "_flags",
+        "_last_validated",
+        "user_id",
+        "device_id",
+        "session_id",
+        "access_token",
+        "_auth_header",
+        "client_version",
+        "_headers_base",
+        "_headers_gql",
+    )
+
     def __init__(self, twitch: Twitch):
         self._twitch: Twitch = twitch
         self._lock = asyncio.Lock()
         self._logged_in = asyncio.Event()
+        # headers() results for the current state, keyed by (user_agent, gql),
+        # dropped whenever the values they're built from change
+        self._headers_cache: dict[tuple[str, bool], Mapping[str, str]] = {}
+        # bitmask of the attributes below that are currently set
+        self._flags: int = 0
+        # monotonic time of the last successful access token validation
+        self._last_validated: float = 0.0
         self.user_id: int
         self.device_id: str
         self.session_id: str
         self.access_token: str
+        # the Authorization header value for the access token, set along with it
+        self._auth_header: str
         self.client_version: str
+        # NOTE: The client type is fixed for the lifetime of the client,
+        # so the static parts of the headers are built only once
+        client_info: ClientInfo = twitch._client_type
+        self._headers_base: dict[str, str] = {
+            "Accept": "*/*",
+            "Accept-Encoding": "gzip",
+            "Accept-Language": "en-US",
+            "Pragma": "no-cache",
+            "Cache-Control": "no-cache",
+            "Client-Id": client_info.CLIENT_ID,
+        }
+        # GQL requests always carry a JSON body, encoded by the GQL client
+        self._headers_gql: dict[str, str] = {
+            "Content-Type": "application/json",
+            "Origin": client_info.CLIENT_URL_STR,
+            "Referer": client_info.CLIENT_URL_STR,
+        }
 
-    def _hasattrs(self, *attrs: str) -> bool:
-        """Check if all specified attributes exist."""
-        return all(hasattr(self, attr) for attr in attrs)
+    def _hasattrs(self, flags: int) -> bool:
+        """Check if all attributes specified by the flags are set."""
+        return self._flags & flags == flags
 
-    def _delattrs(self, *attrs: str) -> None:
-        """Delete all specified attributes if they exist."""
-        for attr in attrs:
-            if hasattr(self, attr):
-                delattr(self, attr)
+    def _delattrs(self, flags: int) -> None:
+        """Delete all attributes specified by the flags, if they're set."""
+        for flag, attrs in _ATTR_NAMES.items():
+            if self._flags & flag & flags:
+                for attr in attrs:
+                    delattr(self, attr)
+        self._flags &= ~flags
 
-    def clear(self) -> None:
-        """Clear all authentication state."""
-        self._delattrs(
-            "user_id",
-            "device_id",
-            "session_id",
-            "access_token",
-            "client_version",
+    def _set_access_token(self, access_token: str) -> None:
+        """Set the access token, along with the Authorization header value that uses it."""
+        self.access_token = access_token
+        self._auth_header = f"OAuth {access_token}"
+        self._flags |= _ACCESS_TOKEN
+        self._state_changed()
+
+    async def _load_saved(self, cookie: BaseCookie[str]) -> None:
+        """
+        Restore the auth state saved by the last successful validation, if it's still fresh.
+
+        This lets a restart skip the device ID and token validation requests.
+        The saved state is only used if the cookie still holds the same access token,
+        and is removed otherwise.
+
+        Args:
+            cookie: The Twitch cookies from the session's cookie jar
+        """
+        try:
+            data: bytes = await asyncio.to_thread(AUTH_STATE_PATH.read_bytes)
+        except OSError:
+            return
+        try:
+            saved = orjson.loads(data)
+            age: float = time() - saved["validated_at"]
+            access_token = str(saved["access_token"])
+            user_id = int(saved["user_id"])
+            device_id = str(saved["device_id"])
+            usable: bool = (
+                saved["client_id"] == self._twitch._client_type.CLIENT_ID
+                and 0 <= age < _VALIDATION_TTL
+                and "auth-token" in cookie
+                and cookie["auth-token"].value == access_token
+            )
+        except (ValueError, KeyError, TypeError):
+            usable = False
+        if not usable:
+            AUTH_STATE_PATH.unlink(missing_ok=True)
+            return
+        self.user_id = user_id
+        self.device_id = device_id
+        self._flags |= _USER_ID | _DEVICE_ID
+        self._last_validated = monotonic() - age
+        self._set_access_token(access_token)
+
+    async def _save(self) -> None:
+        """
+        Save the validated auth state, readable only by the current user.
+
+        The state is serialized right away, only the file write happens on a worker thread.
+        """
+        data: bytes = orjson.dumps(
+            {
+                "client_id": self._twitch._client_type.CLIENT_ID,
+                "validated_at": time() - (monotonic() - self._last_validated),
+                "access_token": self.access_token,
+                "user_id": self.user_id,
+                "device_id": self.device_id,
+            }
         )
+        await asyncio.to_thread(self._write_saved, data)
+
+    @staticmethod
+    def _write_saved(data: bytes) -> None:
+        """Write the serialized auth state to its file."""
+        # write to a sibling file first and swap it in, so an interrupted save can't truncate it
+        temp_path = AUTH_STATE_PATH.with_name(f"{AUTH_STATE_PATH.name}.tmp")
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, AUTH_STATE_PATH)
+
+    def _state_changed(self) -> None:
+        """Drop the headers built for the previous authentication state."""
+        self._headers_cache.clear()
+
+    def clear(self) -> None:
+        """
+        Clear all authentication state.
+
+        The saved auth state is kept, to be restored on the next start.
+        """
+        self._delattrs(_LOGGED_IN | _CLIENT_VERSION)
+        self._last_validated = 0.0
+        self._state_changed()
         self._logged_in.clear()
 
     async def _oauth_login(self) -> str:
@@ -80,30 +229,30 @@ class _AuthState:
         """
         login_form: LoginForm = self._twitch.gui.login
         client_info: ClientInfo = self._twitch._client_type
-        headers = {
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "Accept-Language": "en-US",
-            "Cache-Control": "no-cache",
-            "Client-Id": client_info.CLIENT_ID,
-            "Host": "id.twitch.tv",
-            "Origin": str(client_info.CLIENT_URL),
-            "Pragma": "no-cache",
-            "Referer": str(client_info.CLIENT_URL),
-            "User-Agent": client_info.USER_AGENT,
-            "X-Device-Id": self.device_id,
-        }
+        # NOTE: The same headers are sent with every poll, so they're converted
+        # into the case-insensitive mapping aiohttp uses only once
+        headers = CIMultiDict(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip",
+                "Accept-Language": "en-US",
+                "Cache-Control": "no-cache",
+                "Client-Id": client_info.CLIENT_ID,
+                "Host": "id.twitch.tv",
+                "Origin": client_info.CLIENT_URL_STR,
+                "Pragma": "no-cache",
+                "Referer": client_info.CLIENT_URL_STR,
+                "User-Agent": client_info.USER_AGENT,
+                "X-Device-Id": self.device_id,
+            }
+        )
         payload = {
             "client_id": client_info.CLIENT_ID,
             "scopes": "",  # no scopes needed
         }
         while True:
             try:
-                from datetime import datetime, timedelta, timezone
-
-                from src.exceptions import RequestInvalid
-
-                now = datetime.now(timezone.utc)
+                now = datetime.now(UTC)
                 async with self._twitch.request(
                     "POST", "https://id.twitch.tv/oauth2/device", headers=headers, data=payload
                 ) as response:
@@ -114,7 +263,7 @@ class _AuthState:
                     #     "user_code": "8 chars [A-Z]",
                     #     "verification_uri": "https://www.twitch.tv/activate?device-code=ABCDEFGH"
                     # }
-                    response_json: JsonType = await response.json()
+                    response_json: JsonType = await response.json(loads=orjson.loads)
                     device_code: str = response_json["device_code"]
                     user_code: str = response_json["user_code"]
                     interval: int = response_json["interval"]
@@ -142,57 +291,69 @@ class _AuthState:
                         # 200 means success, 400 means the user haven't entered the code yet
                         if response.status != 200:
                             continue
-                        response_json = await response.json()
+                        response_json = await response.json(loads=orjson.loads)
                         # {
                         #     "access_token": "40 chars [A-Za-z0-9]",
                         #     "refresh_token": "40 chars [A-Za-z0-9]",
                         #     "scope": [...],
                         #     "token_type": "bearer"
                         # }
-                        self.access_token = cast(str, response_json["access_token"])
+                        self._set_access_token(response_json["access_token"])
                         return self.access_token
             except RequestInvalid:
                 # the device_code has expired, request a new code
                 continue
 
-    def headers(self, *, user_agent: str = "", gql: bool = False) -> JsonType:
+    def headers(self, *, user_agent: str = "", gql: bool = False) -> Mapping[str, str]:
         """
         Build HTTP headers for Twitch API requests.
 
+        The result is cached until the authentication state changes,
+        and is returned as a read-only mapping shared between callers.
+
         Args:
             user_agent: Optional custom User-Agent string
             gql: If True, include GraphQL-specific headers
 
         Returns:
-            Dictionary of HTTP headers
+            Read-only mapping of HTTP headers
         """
-        client_info: ClientInfo = self._twitch._client_type
-        headers = {
-            "Accept": "*/*",
-            "Accept-Encoding": "gzip",
-            "Accept-Language": "en-US",
-            "Pragma": "no-cache",
-            "Cache-Control": "no-cache",
-            "Client-Id": client_info.CLIENT_ID,
-        }
+        key = (user_agent, gql)
+        if (cached := self._headers_cache.get(key)) is not None:
+            return cached
+        headers = self._headers_base.copy()
         if user_agent:
             headers["User-Agent"] = user_agent
-        if hasattr(self, "session_id"):
+        if self._flags & _SESSION_ID:
             headers["Client-Session-Id"] = self.session_id
-        # if hasattr(self, "client_version"):
+        # if self._flags & _CLIENT_VERSION:
         # headers["Client-Version"] = self.client_version
-        if hasattr(self, "device_id"):
+        if self._flags & _DEVICE_ID:
             headers["X-Device-Id"] = self.device_id
         if gql:
-            headers["Origin"] = str(client_info.CLIENT_URL)
-            headers["Referer"] = str(client_info.CLIENT_URL)
-            headers["Authorization"] = f"OAuth {self.access_token}"
-        return headers
+            headers.update(self._headers_gql)
+            headers["Authorization"] = self._auth_header
+        self._headers_cache[key] = result = MappingProxyType(headers)
+        return result
+
+    def _is_validated(self) -> bool:
+        """Check if the state is complete and the access token has been validated recently."""
+        return self._hasattrs(_LOGGED_IN) and monotonic() - self._last_validated < _VALIDATION_TTL
 
     async def validate(self):
-        """Thread-safe wrapper for _validate()."""
+        """
+        Thread-safe wrapper for _validate().
+
+        Returns right away, without taking the lock,
+        if the state is complete and the access token has been validated within the last hour.
+        """
+        if self._is_validated():
+            return self
         async with self._lock:
-            await self._validate()
+            # NOTE: Concurrent callers queue up on the lock while the first one validates,
+            # and then reuse its result instead of validating again
+            if not self._is_validated():
+                await self._validate()
         return self
 
     async def _validate(self):
@@ -201,21 +362,29 @@ class _AuthState:
 
         This method:
         1. Generates session ID if needed
-        2. Extracts device ID from Twitch cookies
-        3. Validates existing access token or initiates login flow
-        4. Ensures token client ID matches expected client
-        5. Saves validated cookies to disk
+        2. Restores the auth state saved by the last validation, if it's still usable
+        3. Extracts device ID from Twitch cookies
+        4. Validates existing access token or initiates login flow
+        5. Ensures token client ID matches expected client
+        6. Saves validated cookies and auth state to disk
 
         Raises:
             RuntimeError: On repeated validation failures
         """
-        if not hasattr(self, "session_id"):
-            self.session_id = create_nonce(CHARS_HEX_LOWER, 16)
-        if not self._hasattrs("device_id", "access_token", "user_id"):
+        if not self._flags & _SESSION_ID:
+            self.session_id = secrets.token_hex(8)
+            self._flags |= _SESSION_ID
+            self._state_changed()
+        revalidate: bool = monotonic() - self._last_validated >= _VALIDATION_TTL
+        if revalidate or not self._hasattrs(_DEVICE_ID | _ACCESS_TOKEN | _USER_ID):
             session = await self._twitch.get_session()
-            jar = cast(aiohttp.CookieJar, session.cookie_jar)
+            jar: aiohttp.CookieJar = session.cookie_jar  # type: ignore[assignment]
             client_info: ClientInfo = self._twitch._client_type
-        if not self._hasattrs("device_id"):
+            if not self._flags & _ACCESS_TOKEN:
+                # first validation after a start, or after the access token has been invalidated
+                await self._load_saved(jar.filter_cookies(client_info.CLIENT_URL))
+                revalidate = monotonic() - self._last_validated >= _VALIDATION_TTL
+        if not self._flags & _DEVICE_ID:
             async with self._twitch.request(
                 "GET", client_info.CLIENT_URL, headers=self.headers()
             ) as response:
@@ -228,34 +397,43 @@ class _AuthState:
             # doing the request ends up setting the "unique_id" value in the cookie
             cookie = jar.filter_cookies(client_info.CLIENT_URL)
             self.device_id = cookie["unique_id"].value
-        if not self._hasattrs("access_token", "user_id"):
-            # looks like we're missing something
+            self._flags |= _DEVICE_ID
+            self._state_changed()
+        if revalidate or not self._hasattrs(_ACCESS_TOKEN | _USER_ID):
+            # looks like we're missing something, or the access token is due for validation
             login_form: LoginForm = self._twitch.gui.login
-            logger.info("Checking login")
-            login_form.update(_.t["login"]["status"]["logging_in"], None)
+            # NOTE: The hourly revalidation of the token in use happens in the background,
+            # the login status is only shown if it turns out a new login is needed
+            logging_in: bool = not self._hasattrs(_ACCESS_TOKEN | _USER_ID)
+            if logging_in:
+                logger.info("Checking login")
+                login_form.update(_.t["login"]["status"]["logging_in"], None)
+            # NOTE: The jar is only refiltered after it's been cleared
+            cookie = jar.filter_cookies(client_info.CLIENT_URL)
             for _client_mismatch_attempt in range(2):
                 for _invalid_token_attempt in range(2):
-                    cookie = jar.filter_cookies(client_info.CLIENT_URL)
                     if "auth-token" not in cookie:
-                        self.access_token = await self._oauth_login()
-                        cookie["auth-token"] = self.access_token
-                    elif not hasattr(self, "access_token"):
+                        AUTH_STATE_PATH.unlink(missing_ok=True)
+                        cookie["auth-token"] = await self._oauth_login()
+                    elif not self._flags & _ACCESS_TOKEN:
                         logger.info("Restoring session from cookie")
-                        self.access_token = cookie["auth-token"].value
+                        self._set_access_token(cookie["auth-token"].value)
                     # validate the auth token, by obtaining user_id
                     async with self._twitch.request(
                         "GET",
                         "https://id.twitch.tv/oauth2/validate",
-                        headers={"Authorization": f"OAuth {self.access_token}"},
+                        headers={"Authorization": self._auth_header},
                     ) as response:
                         if response.status == 401:
                             # the access token we have is invalid - clear the cookie and reauth
                             logger.info("Restored session is invalid")
-                            assert client_info.CLIENT_URL.host is not None
-                            jar.clear_domain(client_info.CLIENT_URL.host)
+                            logging_in = True
+                            jar.clear_domain(client_info.CLIENT_URL_HOST)
+                            AUTH_STATE_PATH.unlink(missing_ok=True)
+                            cookie = jar.filter_cookies(client_info.CLIENT_URL)
                             continue
                         elif response.status == 200:
-                            validate_response = await response.json()
+                            validate_response = await response.json(loads=orjson.loads)
                             break
                 else:
                     raise RuntimeError("Login verification failure (step #2)")
@@ -264,19 +442,45 @@ class _AuthState:
                     break
                 # otherwise, we need to delete the entire cookie file and clear the jar
                 logger.info("Cookie client ID mismatch")
+                logging_in = True
                 jar.clear()
                 COOKIES_PATH.unlink(missing_ok=True)
+                AUTH_STATE_PATH.unlink(missing_ok=True)
+                cookie = jar.filter_cookies(client_info.CLIENT_URL)
             else:
                 raise RuntimeError("Login verification failure (step #1)")
             self.user_id = int(validate_response["user_id"])
+            self._flags |= _USER_ID
+            self._last_validated = monotonic()
+            self._state_changed()
             cookie["persistent"] = str(self.user_id)
-            logger.info(f"Login successful, user ID: {self.user_id}")
-            login_form.update(_.t["login"]["status"]["logged_in"], self.user_id)
-            # update our cookie and save it
+            if logging_in:
+                logger.info(f"Login successful, user ID: {self.user_id}")
+                login_form.update(_.t["login"]["status"]["logged_in"], self.user_id)
+            else:
+                logger.debug("Access token revalidated")
+            # update our cookie, and save it if the access token has changed
+            # NOTE: The jar is saved on shutdown as well, so a revalidation of the same token
+            # doesn't have to write it out again
+            stored_token = jar.filter_cookies(client_info.CLIENT_URL).get("auth-token")
             jar.update_cookies(cookie, client_info.CLIENT_URL)
-            jar.save(COOKIES_PATH)
+            if stored_token is None or stored_token.value != self.access_token:
+                await save_cookie_jar(jar, COOKIES_PATH)
+            await self._save()
+        elif not self._logged_in.is_set():
+            # the auth state has been restored from disk
+            logger.info(f"Login restored, user ID: {self.user_id}")
+            self._twitch.gui.login.update(_.t["login"]["status"]["logged_in"], self.user_id)
         self._logged_in.set()
 
-    def invalidate(self):
-        """Invalidate the current access token."""
-        self._delattrs("access_token")
+    def invalidate(self) -> None:
+        """
+        Invalidate the current access token, after it's been rejected by Twitch.
+
+        The next validation restores it from the cookie and checks it again,
+        logging in anew if it's no longer valid.
+        """
+        self._delattrs(_ACCESS_TOKEN)
+        self._last_validated = 0.0
+        self._state_changed()
+        AUTH_STATE_PATH.unlink(missing_ok=True)
@@ -34,6 +34,7 @@ from .constants import (
 )
 from .operations import GQL_OPERATIONS
 from .paths import (
+    AUTH_STATE_PATH,
     COOKIES_PATH,
     DATA_DIR,
     LANG_PATH,
@@ -73,6 +74,7 @@ __all__ = [
     "DATA_DIR",
     "LANG_PATH",
     "COOKIES_PATH",
+    "AUTH_STATE_PATH",
     "SETTINGS_PATH",
     "_merge_vars",
     # client_info.py
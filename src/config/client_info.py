@@ -10,11 +10,15 @@ from yarl import URL
 class ClientInfo:
     """Client configuration including URL, ID, and User-Agent."""
 
-    def __init__(self, client_url: URL, client_id: str, user_agents: str | list[str]) -> None:
+    def __init__(self, client_url: URL, client_id: str, user_agents: str | tuple[str, ...]) -> None:
         self.CLIENT_URL: URL = client_url
+        self.CLIENT_URL_STR: str = str(client_url)
+        self.CLIENT_URL_HOST: str = client_url.host or ""
         self.CLIENT_ID: str = client_id
         self.USER_AGENT: str
-        if isinstance(user_agents, list):
+        # NOTE: The user agent is picked once, when the predefined client types
+        # are created at import time, so it stays the same for the entire run
+        if isinstance(user_agents, tuple):
             self.USER_AGENT = random.choice(user_agents)
         else:
             self.USER_AGENT = user_agents
@@ -37,7 +41,7 @@ class ClientType:
     MOBILE_WEB = ClientInfo(
         URL("https://m.twitch.tv"),
         "r8s4dac0uhzifbpu9sjdiwzctle17ff",
-        [
+        (
             # Chrome versioning is done fully on android only,
             # other platforms only use the major version
             (
@@ -68,12 +72,12 @@ class ClientType:
                 "Mozilla/5.0 (Linux; Android 16; LM-X420) AppleWebKit/537.36 "
                 "(KHTML, like Gecko) Chrome/138.0.7204.158 Mobile Safari/537.36"
             ),
-        ],
+        ),
     )
     ANDROID_APP = ClientInfo(
         URL("https://www.twitch.tv"),
         "kd1unb4b3q4t58fwlpcbzcbnm76a8fp",
-        [
+        (
             (
                 "Dalvik/2.1.0 (Linux; U; Android 16; SM-S911B Build/TP1A.220624.014) "
                 "tv.twitch.android.app/25.3.0/2503006"
@@ -102,7 +106,7 @@ class ClientType:
                 "Dalvik/2.1.0 (Linux; U; Android 14; SM-X306B Build/UP1A.231005.007) "
                 "tv.twitch.android.app/25.3.0/2503006"
             ),
-        ],
+        ),
     )
     SMARTBOX = ClientInfo(
         URL("https://android.tv.twitch.tv"),
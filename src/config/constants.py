@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import logging
 import sys
-from copy import deepcopy
+from collections.abc import Mapping
 from datetime import timedelta
 from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Literal, NewType
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Literal, NewType
 
 
 if TYPE_CHECKING:
@@ -40,23 +41,23 @@ TopicProcess: TypeAlias = "abc.Callable[[int, JsonType], Any]"
 GQLRequest: TypeAlias = "GQLOperation | GQLQuery"
 
 # Core constants
-MAX_INT = sys.maxsize
-MAX_EXTRA_MINUTES = 15
-BASE_TOPICS = 2
-MAX_WEBSOCKETS = 8
-WS_TOPICS_LIMIT = 50
-TOPICS_PER_CHANNEL = 2
-MAX_TOPICS = (MAX_WEBSOCKETS * WS_TOPICS_LIMIT) - BASE_TOPICS
-MAX_CHANNELS = MAX_TOPICS // TOPICS_PER_CHANNEL
+MAX_INT: Final = sys.maxsize
+MAX_EXTRA_MINUTES: Final = 15
+BASE_TOPICS: Final = 2
+MAX_WEBSOCKETS: Final = 8
+WS_TOPICS_LIMIT: Final = 50
+TOPICS_PER_CHANNEL: Final = 2
+MAX_TOPICS: Final = (MAX_WEBSOCKETS * WS_TOPICS_LIMIT) - BASE_TOPICS  # 398
+MAX_CHANNELS: Final = MAX_TOPICS // TOPICS_PER_CHANNEL  # 199
 
 # Misc
-DEFAULT_LANG = "English"
+DEFAULT_LANG: Final = "English"
 
 # Intervals and Delays
-PING_INTERVAL = timedelta(minutes=3)
-PING_TIMEOUT = timedelta(seconds=10)
-ONLINE_DELAY = timedelta(seconds=120)
-WATCH_INTERVAL = timedelta(seconds=59)
+PING_INTERVAL: Final = timedelta(minutes=3)
+PING_TIMEOUT: Final = timedelta(seconds=10)
+ONLINE_DELAY: Final = timedelta(seconds=120)
+WATCH_INTERVAL: Final = timedelta(seconds=59)
 
 
 class State(Enum):
@@ -89,12 +90,16 @@ class GQLOperation(JsonType):
 
     def with_variables(self, variables: JsonType) -> GQLOperation:
         """Create a copy with merged variables."""
-        from .paths import _merge_vars
+        from .paths import _copy_nested, _merge_vars
 
-        modified = deepcopy(self)
+        # NOTE: Only the variable dicts are modified by the merge, so they're the only part
+        # that needs copying, while the persisted query extensions are shared
+        modified = GQLOperation.__new__(GQLOperation)
+        modified.update(self)
         if "variables" in self:
-            existing_variables: JsonType = modified["variables"]
+            existing_variables: JsonType = _copy_nested(self["variables"])
             _merge_vars(existing_variables, variables)
+            modified["variables"] = existing_variables
         else:
             modified["variables"] = variables
         return modified
@@ -127,13 +132,16 @@ class WebsocketTopic:
         process: TopicProcess,
     ):
         assert isinstance(target_id, int)
-        self._id: str = self.as_str(category, topic_name, target_id)
+        # NOTE: The ID is interned, as it's used as a lookup key on every received message
+        self._id: str = sys.intern(self.as_str(category, topic_name, target_id))
         self._target_id = target_id
         self._process: TopicProcess = process
+        # topics are used as dict keys and set members, so the hash is computed only once
+        self._hash: int = hash((self.__class__.__name__, self._id))
 
-    @classmethod
-    def as_str(cls, category: Literal["User", "Channel"], topic_name: str, target_id: int) -> str:
-        return f"{WEBSOCKET_TOPICS[category][topic_name]}.{target_id}"
+    @staticmethod
+    def as_str(category: Literal["User", "Channel"], topic_name: str, target_id: int) -> str:
+        return f"{_TOPIC_PREFIXES[category, topic_name]}.{target_id}"
 
     def __call__(self, message: JsonType):
         return self._process(self._target_id, message)
@@ -145,17 +153,19 @@ class WebsocketTopic:
         return f"Topic({self._id})"
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, WebsocketTopic):
+        if self is other:
+            return True
+        elif isinstance(other, WebsocketTopic):
             return self._id == other._id
         elif isinstance(other, str):
             return self._id == other
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((self.__class__.__name__, self._id))
+        return self._hash
 
 
-WEBSOCKET_TOPICS: dict[str, dict[str, str]] = {
+_WEBSOCKET_TOPICS: dict[str, dict[str, str]] = {
     "User": {  # Using user_id
         "Presence": "presence",  # unused
         "Drops": "user-drop-events",
@@ -169,3 +179,18 @@ WEBSOCKET_TOPICS: dict[str, dict[str, str]] = {
         "CommunityPoints": "community-points-channel-v1",  # unused
     },
 }
+# read-only view of the above, with the topic prefixes interned
+WEBSOCKET_TOPICS: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {
+        category: MappingProxyType(
+            {topic_name: sys.intern(prefix) for topic_name, prefix in topics.items()}
+        )
+        for category, topics in _WEBSOCKET_TOPICS.items()
+    }
+)
+# flat (category, topic_name) index of the above, for building topic strings with a single lookup
+_TOPIC_PREFIXES: dict[tuple[str, str], str] = {
+    (category, topic_name): prefix
+    for category, topics in WEBSOCKET_TOPICS.items()
+    for topic_name, prefix in topics.items()
+}
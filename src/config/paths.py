@@ -12,26 +12,39 @@ def _merge_vars(base_vars: dict[str, Any], vars: dict[str, Any]) -> None:
 
     NOTE: This modifies base_vars in place.
     """
-    for k, v in vars.items():
-        if k not in base_vars:
-            base_vars[k] = v
-        elif isinstance(v, dict):
-            if isinstance(base_vars[k], dict):
-                _merge_vars(base_vars[k], v)
-            elif base_vars[k] is Ellipsis:
-                # unspecified base, use the passed in var
-                base_vars[k] = v
+    # NOTE: nested dicts are merged via an explicit stack of (base, vars) pairs
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(base_vars, vars)]
+    while stack:
+        base, incoming = stack.pop()
+        for k, v in incoming.items():
+            if k not in base:
+                base[k] = v
+            elif type(v) is dict:
+                if type(base[k]) is dict:
+                    stack.append((base[k], v))
+                elif base[k] is Ellipsis:
+                    # unspecified base, use the passed in var
+                    base[k] = v
+                else:
+                    raise RuntimeError(f"Var is a dict, base is not: '{k}'")
+            elif type(base[k]) is dict:
+                raise RuntimeError(f"Base is a dict, var is not: '{k}'")
             else:
-                raise RuntimeError(f"Var is a dict, base is not: '{k}'")
-        elif isinstance(base_vars[k], dict):
-            raise RuntimeError(f"Base is a dict, var is not: '{k}'")
-        else:
-            # simple overwrite
-            base_vars[k] = v
-    # ensure none of the vars are ellipsis (unset value)
-    for k, v in base_vars.items():
-        if v is Ellipsis:
-            raise RuntimeError(f"Unspecified variable: '{k}'")
+                # simple overwrite
+                base[k] = v
+        # ensure none of the vars are ellipsis (unset value)
+        for k, v in base.items():
+            if v is Ellipsis:
+                raise RuntimeError(f"Unspecified variable: '{k}'")
+
+
+def _copy_nested(obj: Any) -> Any:
+    """Copy a value along with all of its nested dicts and lists, sharing every other value."""
+    if type(obj) is dict:
+        return {k: _copy_nested(v) for k, v in obj.items()}
+    elif type(obj) is list:
+        return [_copy_nested(v) for v in obj]
+    return obj
 
 
 # Base Paths - environment-specific resolution
@@ -39,8 +52,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 
 # Ensure data directory exists
-if not DATA_DIR.exists():
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 # Translations path
 # NOTE: These don't have to be available to the end-user, so the path points to the internal dir
@@ -48,4 +60,5 @@ LANG_PATH = PROJECT_ROOT / "lang"
 
 # Persistent storage paths - use DATA_DIR for Docker compatibility
 COOKIES_PATH = DATA_DIR / "cookies.jar"
+AUTH_STATE_PATH = DATA_DIR / "auth_state.json"
 SETTINGS_PATH = DATA_DIR / "settings.json"
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TypedDict
-
-from yarl import URL
+from typing import Any, TypedDict
 
 from src.config import DEFAULT_LANG, SETTINGS_PATH
+from src.config.paths import _copy_nested
 from src.utils import json_load, json_save
 
 
@@ -51,6 +50,21 @@ default_settings = {
 }
 
 
+def _fresh_defaults() -> dict[str, Any]:
+    """
+    Copy the default settings, along with all of their nested dicts and lists.
+
+    The loaded settings take the missing values from these, so they must not share
+    any containers with the module-level defaults.
+    """
+    return _copy_nested(default_settings)
+
+
+def clamp_connection_quality(value: int) -> int:
+    """Limit the connection quality setting to its supported 1-6 range."""
+    return min(max(value, 1), 6)
+
+
 @dataclass
 class Settings:
     connection_quality: int
@@ -68,12 +82,11 @@ class Settings:
 
     def load(self):
         # TODO: remvoe customized serde in the future
-        settings = json_load(SETTINGS_PATH, default_settings, merge=True)
-        for key, value in settings.items():
-            if value is URL:
-                setattr(self, key, str(value))
-            else:
-                setattr(self, key, value)
+        settings = json_load(SETTINGS_PATH, _fresh_defaults(), merge=True)
+        # NOTE: merge_json has already reset any value whose type doesn't match the defaults,
+        # so a proxy saved as a URL object by an old version comes back as the default string
+        vars(self).update(settings)
+        self.connection_quality = clamp_connection_quality(self.connection_quality)
 
     def save(self) -> None:
         json_save(SETTINGS_PATH, vars(self), sort=True)
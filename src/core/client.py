@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections import OrderedDict, abc, deque
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
 from functools import partial
 from time import time
 from typing import TYPE_CHECKING, Any, Final, Literal
@@ -56,6 +56,8 @@ class Twitch:
         # State management
         self._state: State = State.IDLE
         self._state_change = asyncio.Event()
+        # set once the application is requested to close, wakes up any pending retry backoff
+        self._exit_event = asyncio.Event()
         self.wanted_games: list[Game] = []
         self.inventory: list[DropsCampaign] = []
         self._drops: dict[str, TimedDrop] = {}
@@ -106,6 +108,16 @@ class Twitch:
         assert self._http_client is not None
         return await self._http_client.get_session()
 
+    async def warmup(self) -> None:
+        """
+        Open a connection to the GQL endpoint ahead of the first request.
+
+        Delegates to GQLClient.
+        """
+        self._ensure_api_clients()
+        assert self._gql_client is not None
+        await self._gql_client.warmup()
+
     def request(self, method: str, url: str | Any, **kwargs):
         """
         Make an HTTP request (for backward compatibility).
@@ -160,6 +172,7 @@ class Twitch:
         usually by the console or application window being closed.
         """
         self.change_state(State.EXIT)
+        self._exit_event.set()
 
     def print(self, message: str) -> None:
         """Print a message in the GUI."""
@@ -246,7 +259,7 @@ class Twitch:
                 # figure out which games we want based on games_to_watch whitelist
                 self.wanted_games.clear()
                 games_to_watch: list[str] = self.settings.games_to_watch
-                next_hour: datetime = datetime.now(timezone.utc) + timedelta(hours=1)
+                next_hour: datetime = datetime.now(UTC) + timedelta(hours=1)
                 logger.info("games_to_watch: %s", games_to_watch)
                 logger.info(
                     "inventory has %d eligible campaigns",
@@ -340,7 +353,7 @@ class Twitch:
                 # NOTE: we use another set so that we can set them online separately
                 no_acl: set[Game] = set()
                 acl_channels: set[Channel] = set()
-                next_hour = datetime.now(timezone.utc) + timedelta(hours=1)
+                next_hour = datetime.now(UTC) + timedelta(hours=1)
                 for campaign in self.inventory:
                     if campaign.game in self.wanted_games and campaign.can_earn_within(next_hour):
                         if campaign.allowed_channels:
@@ -659,11 +672,13 @@ class Twitch:
         logger.info("=== Active Campaigns Mapping ===")
         from collections import defaultdict
 
+        # the mapping itself is only logged at the debug level, so skip building it otherwise
+        debug: bool = logger.isEnabledFor(logging.DEBUG)
         game_campaign_map: dict[str, list[tuple[DropsCampaign, list[str]]]] = defaultdict(list)
         for campaign in self.inventory:
             if campaign.eligible and not campaign.finished:
                 logger.info("eligible Campaign: %s - %s", campaign.name, campaign.game.name)
-            if campaign.can_earn_within(next_hour):
+            if debug and campaign.can_earn_within(next_hour):
                 channel_names = []
                 if campaign.allowed_channels:
                     channel_names = [ch.name for ch in campaign.allowed_channels]
@@ -671,7 +686,7 @@ class Twitch:
                     channel_names = ["<directory>"]
                 game_campaign_map[campaign.game.name].append((campaign, channel_names))
         for game_name in sorted(game_campaign_map.keys()):
-            logger.debug(f"Game: {game_name}")
+            logger.debug("Game: %s", game_name)
             for campaign, channel_list in game_campaign_map[game_name]:
                 status_info = f"{'ACTIVE' if campaign.active else 'UPCOMING'}"
                 ends_info = campaign.ends_at.astimezone().strftime("%Y-%m-%d %H:%M")
@@ -680,12 +695,16 @@ class Twitch:
                     if channel_list[0] != "<directory>"
                     else "directory"
                 )
-                logger.debug(f"  └─ Campaign: {campaign.name} [{status_info}] (ends: {ends_info})")
-                logger.debug(f"     Channels: {channel_info}")
+                logger.debug(
+                    "  └─ Campaign: %s [%s] (ends: %s)", campaign.name, status_info, ends_info
+                )
+                logger.debug("     Channels: %s", channel_info)
                 if channel_list[0] != "<directory>" and len(channel_list) <= 10:
-                    logger.debug(f"     └─ {', '.join(channel_list)}")
+                    logger.debug("     └─ %s", ", ".join(channel_list))
                 elif channel_list[0] != "<directory>":
                     logger.debug(
-                        f"     └─ {', '.join(channel_list[:10])} ... (+{len(channel_list) - 10} more)"
+                        "     └─ %s ... (+%d more)",
+                        ", ".join(channel_list[:10]),
+                        len(channel_list) - 10,
                     )
         logger.info("=== End Campaigns Mapping ===")
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypedDict, cast
 
+import orjson
+
 from src.config import DEFAULT_LANG, LANG_PATH
 
 
@@ -246,18 +249,37 @@ class Translator:
         self.current_language: str
         self.t: Translation
         # load available languages from JSON files by reading language_name field
-        for filepath in LANG_PATH.glob("*.json"):
-            with filepath.open("r", encoding="utf-8") as json_file:
-                try:
-                    loaded_translation: Translation = json.load(json_file)
-                    self._langs[loaded_translation["language_name"]] = loaded_translation
-                except Exception as e:
-                    # if we can't read the file, skip it
-                    self.logger.warning(f"Failed to load language file {filepath}: {e}")
-                    continue
-        self._langs = dict(sorted(self._langs.items()))
+        # NOTE: the listing order doesn't matter, as the languages are sorted by name afterwards
+        with os.scandir(LANG_PATH) as entries:
+            filepaths: list[str] = [
+                entry.path for entry in entries if entry.name.endswith(".json") and entry.is_file()
+            ]
+        # NOTE: each file is independent, so the reads are overlapped on a thread pool
+        with ThreadPoolExecutor() as executor:
+            loaded_translations: list[Translation] = [
+                loaded_translation
+                for loaded_translation in executor.map(self._load_file, filepaths)
+                if loaded_translation is not None
+            ]
+        # sort before inserting, so the mapping is built once, already ordered by language name
+        loaded_translations.sort(key=lambda translation: translation["language_name"])
+        for loaded_translation in loaded_translations:
+            self._langs[loaded_translation["language_name"]] = loaded_translation
         self.set_language(DEFAULT_LANG)
 
+    def _load_file(self, filepath: str) -> Translation | None:
+        """Load a single language file, returning None if it can't be used."""
+        try:
+            with open(filepath, "rb") as json_file:
+                loaded_translation: Translation = orjson.loads(json_file.read())
+            if "language_name" not in loaded_translation:
+                raise KeyError("language_name")
+        except Exception as e:
+            # if we can't read the file, skip it
+            self.logger.warning(f"Failed to load language file {filepath}: {e}")
+            return None
+        return loaded_translation
+
     def get_languages(self) -> list[str]:
         return list(self._langs.keys())
 
@@ -227,7 +227,7 @@ class Channel:
 
     @property
     def url(self) -> URLType:
-        return URLType(f"{self._twitch._client_type.CLIENT_URL}/{self._login}")
+        return URLType(f"{self._twitch._client_type.CLIENT_URL_STR}/{self._login}")
 
     @property
     def iid(self) -> str:
@@ -9,13 +9,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from dateutil.parser import isoparse
 
 from src.api import GQLClient
-from src.config import GQL_OPERATIONS
+from src.config import GQL_OPERATIONS, State
 from src.exceptions import ExitRequest
 from src.i18n import _
 from src.models import DropsCampaign
@@ -161,7 +161,7 @@ class InventoryService:
         self._twitch.inventory.clear()
         self._twitch._mnt_triggers.clear()
         switch_triggers: set[datetime] = set()
-        next_hour = datetime.now(timezone.utc) + timedelta(hours=1)
+        next_hour = datetime.now(UTC) + timedelta(hours=1)
 
         # add the campaigns to the internal inventory
         for campaign in campaigns:
@@ -190,8 +190,6 @@ class InventoryService:
                     )
                 )
                 # this is needed here explicitly, because cache reads from disk don't raise this
-                from src.config import State
-
                 if self._twitch._state == State.EXIT:
                     raise ExitRequest()
         except Exception:
@@ -203,7 +201,7 @@ class InventoryService:
         self._twitch._mnt_triggers.extend(sorted(switch_triggers))
 
         # trim out all triggers that we're already past
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         while self._twitch._mnt_triggers and self._twitch._mnt_triggers[0] <= now:
             self._twitch._mnt_triggers.popleft()
 
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta
 
 from src.config.settings import Settings
 from src.models.campaign import DropsCampaign
@@ -16,7 +16,7 @@ class StreamSelector:
         wanted_games = []
         games_to_watch = settings.games_to_watch
         mining_benefits = settings.mining_benefits
-        next_hour = datetime.now(timezone.utc) + timedelta(hours=1)
+        next_hour = datetime.now(UTC) + timedelta(hours=1)
 
         for game_name in games_to_watch:
             wanted_campaigns = []
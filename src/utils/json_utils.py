@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+import os
 from collections.abc import Callable, Mapping
-from datetime import datetime, timezone
+from contextlib import suppress
+from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, TypeVar, cast
@@ -22,7 +24,7 @@ _MISSING = object()
 SERIALIZE_ENV: dict[str, Callable[[Any], object]] = {
     "set": set,
     "URL": URL,
-    "datetime": lambda d: datetime.fromtimestamp(d, timezone.utc),
+    "datetime": lambda d: datetime.fromtimestamp(d, UTC),
 }
 
 
@@ -33,7 +35,7 @@ def json_minify(data: JsonType | list[JsonType]) -> str:
 
 def isonow() -> str:
     """Return the current UTC time in Twitch's expected ISO-8601 format."""
-    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
 
 def _serialize(obj: Any) -> Any:
@@ -48,7 +50,7 @@ def _serialize(obj: Any) -> Any:
     if isinstance(obj, datetime):
         if obj.tzinfo is None:
             # assume naive objects are UTC
-            obj = obj.replace(tzinfo=timezone.utc)
+            obj = obj.replace(tzinfo=UTC)
         d = obj.timestamp()
     elif isinstance(obj, set):
         d = list(obj)
@@ -142,8 +144,10 @@ def json_load(path: Path, defaults: _JSON_T, *, merge: bool = True) -> _JSON_T:
     """
     defaults_dict: JsonType = dict(defaults)
     if path.exists():
-        with open(path, encoding="utf8") as file:
-            combined: JsonType = _remove_missing(json.load(file, object_hook=_deserialize))
+        # NOTE: reading the whole file at once and parsing it from memory is faster than json.load
+        combined: JsonType = _remove_missing(
+            json.loads(path.read_bytes(), object_hook=_deserialize)
+        )
         if merge:
             merge_json(combined, defaults_dict)
     else:
@@ -159,6 +163,17 @@ def json_save(path: Path, contents: Mapping[Any, Any], *, sort: bool = False) ->
         path: Path to save JSON file
         contents: Data to serialize
         sort: If True, sort keys alphabetically
+
+    The file is replaced atomically, and left untouched if its contents would not change.
     """
-    with open(path, "w", encoding="utf8") as file:
-        json.dump(contents, file, default=_serialize, sort_keys=sort, indent=4)
+    # serialize up-front, so the file receives a single binary write
+    data: bytes = json.dumps(contents, default=_serialize, sort_keys=sort, indent=4).encode("utf8")
+    # skip the write entirely if the file already holds these exact contents
+    with suppress(OSError):
+        if path.read_bytes() == data:
+            return
+    # write to a sibling file first and swap it in, so an interrupted save can't truncate the file
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
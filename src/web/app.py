@@ -14,6 +14,7 @@ from pydantic import BaseModel
 
 
 if TYPE_CHECKING:
+    import aiohttp
     import uvicorn
 
     from src.core.client import Twitch
@@ -46,6 +47,7 @@ socket_app = socketio.ASGIApp(sio, app)
 gui_manager: WebGUIManager | None = None
 twitch_client: Twitch | None = None
 _server_instance: uvicorn.Server | None = None
+_http_session: aiohttp.ClientSession | None = None
 
 
 def set_managers(gui: WebGUIManager, twitch: Twitch):
@@ -56,6 +58,16 @@ def set_managers(gui: WebGUIManager, twitch: Twitch):
     gui.set_socketio(sio)
 
 
+def _get_http_session() -> aiohttp.ClientSession:
+    """Get the HTTP session shared by outbound API requests, creating it if needed."""
+    global _http_session
+    import aiohttp
+
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession()
+    return _http_session
+
+
 # Pydantic models for API
 class LoginRequest(BaseModel):
     username: str
@@ -224,10 +236,10 @@ async def verify_proxy(request: ProxyVerifyRequest):
     try:
         start_time = time.time()
         # Test connection to Twitch
-        async with (
-            aiohttp.ClientSession() as session,
-            session.get("https://www.twitch.tv", proxy=proxy_url, timeout=10) as response,
-        ):
+        session = _get_http_session()
+        async with session.get(
+            "https://www.twitch.tv", proxy=proxy_url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
             # Just checking if we can connect and get a response
             if response.status < 500:
                 latency = round((time.time() - start_time) * 1000)
@@ -259,12 +271,11 @@ async def get_version():
 
     try:
         # Check GitHub API for latest release
-        async with (
-            aiohttp.ClientSession() as session,
-            session.get(
-                "https://api.github.com/repos/rangermix/TwitchDropsMiner/releases/latest", timeout=5
-            ) as response,
-        ):
+        session = _get_http_session()
+        async with session.get(
+            "https://api.github.com/repos/rangermix/TwitchDropsMiner/releases/latest",
+            timeout=aiohttp.ClientTimeout(total=5),
+        ) as response:
             if response.status == 200:
                 data = await response.json()
                 latest_version = data.get("tag_name", "").lstrip("v")
@@ -411,17 +422,33 @@ async def run_server(host: str = "0.0.0.0", port: int = 8080):
     global _server_instance
     import uvicorn
 
-    config = uvicorn.Config(socket_app, host=host, port=port, log_level="info", access_log=False)
+    config = uvicorn.Config(
+        socket_app,
+        host=host,
+        port=port,
+        log_level="info",
+        access_log=False,
+        # bound the graceful shutdown, so that lingering connections can't hold up the exit
+        timeout_graceful_shutdown=5,
+    )
     server = uvicorn.Server(config)
     _server_instance = server
     try:
         await server.serve()
+    except SystemExit as exc:
+        # NOTE: uvicorn calls sys.exit when the server fails to start (i.e. the port is taken),
+        # which would skip the shutdown handling in main, so it's raised as a regular error
+        raise RuntimeError(f"Web server failed to start on {host}:{port}") from exc
     finally:
         _server_instance = None
 
 
 async def shutdown_server():
     """Gracefully shutdown the web server"""
+    global _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
     if _server_instance:
         logger.info("Setting server.should_exit = True")
         _server_instance.should_exit = True
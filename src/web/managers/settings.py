@@ -7,6 +7,7 @@ import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from src.config.settings import clamp_connection_quality
 from src.i18n.translator import _
 from src.models.game import Game
 
@@ -70,6 +71,9 @@ class SettingsManager:
         Args:
             settings_data: Dictionary of settings to update
         """
+        # NOTE: Setting values are always replaced, never modified in place,
+        # so a shallow snapshot is enough to tell if anything changed
+        previous_settings = vars(self._settings).copy()
         should_trigger_update = False
         should_trigger_update |= self.check_and_update_setting(
             "games_to_watch", settings_data.get("games_to_watch"), True
@@ -80,8 +84,11 @@ class SettingsManager:
         should_trigger_update |= self.check_and_update_setting(
             "language", settings_data.get("language"), False, self._set_language
         )
+        connection_quality = settings_data.get("connection_quality")
+        if connection_quality is not None:
+            connection_quality = clamp_connection_quality(connection_quality)
         should_trigger_update |= self.check_and_update_setting(
-            "connection_quality", settings_data.get("connection_quality")
+            "connection_quality", connection_quality
         )
         if "proxy" in settings_data:
             proxy_value = settings_data["proxy"]
@@ -105,7 +112,8 @@ class SettingsManager:
             "mining_benefits", settings_data.get("mining_benefits"), True
         )
 
-        self._settings.save()
+        if vars(self._settings) != previous_settings:
+            self._settings.save()
         asyncio.create_task(self._broadcaster.emit("settings_updated", self.get_settings()))
 
         if should_trigger_update and self._on_change:
@@ -171,11 +171,7 @@ class Websocket:
                 async with session.ws_connect(ws_url, proxy=proxy) as websocket:
                     yield websocket
                     backoff.reset()
-            except (
-                asyncio.TimeoutError,
-                aiohttp.ClientResponseError,
-                aiohttp.ClientConnectionError,
-            ):
+            except (TimeoutError, aiohttp.ClientResponseError, aiohttp.ClientConnectionError):
                 ws_logger.info(
                     f"Websocket[{self._idx}] connection problem (sleep: {round(delay)}s)"
                 )
@@ -194,7 +190,7 @@ class Websocket:
         self.set_status(_.t["gui"]["websocket"]["initializing"])
         await self._twitch.wait_until_login()
         self.set_status(_.t["gui"]["websocket"]["connecting"])
-        ws_logger.debug(f"Websocket[{self._idx}] connecting...")
+        ws_logger.debug("Websocket[%d] connecting...", self._idx)
         self._closed.clear()
         # Connect/Reconnect loop
         async for websocket in self._backoff_connect(
@@ -206,7 +202,7 @@ class Websocket:
             # NOTE: _topics_changed doesn't start set,
             # because there's no initial topics we can sub to right away
             self.set_status(_.t["gui"]["websocket"]["connected"])
-            ws_logger.debug(f"Websocket[{self._idx}] connected.")
+            ws_logger.debug("Websocket[%d] connected.", self._idx)
             try:
                 try:
                     while not self._reconnect_requested.is_set():
@@ -266,7 +262,7 @@ class Websocket:
         removed = self._submitted.difference(current)
         if removed:
             topics_list = list(map(str, removed))
-            ws_logger.debug(f"Websocket[{self._idx}]: Removing topics: {', '.join(topics_list)}")
+            ws_logger.debug("Websocket[%d]: Removing topics: %s", self._idx, ", ".join(topics_list))
             for topics in chunk(topics_list, 10):
                 await self.send(
                     {
@@ -282,7 +278,7 @@ class Websocket:
         added = current.difference(self._submitted)
         if added:
             topics_list = list(map(str, added))
-            ws_logger.debug(f"Websocket[{self._idx}]: Adding topics: {', '.join(topics_list)}")
+            ws_logger.debug("Websocket[%d]: Adding topics: %s", self._idx, ", ".join(topics_list))
             for topics in chunk(topics_list, 10):
                 await self.send(
                     {
@@ -310,7 +306,7 @@ class Websocket:
         assert ws is not None
         while True:
             raw_message: aiohttp.WSMessage = await ws.receive(timeout=timeout)
-            ws_logger.debug(f"Websocket[{self._idx}] received: {raw_message}")
+            ws_logger.debug("Websocket[%d] received: %s", self._idx, raw_message)
             if raw_message.type is WSMsgType.TEXT:
                 message: JsonType = json.loads(raw_message.data)
                 messages.append(message)
@@ -408,4 +404,4 @@ class Websocket:
         if message["type"] != "PING":
             message["nonce"] = create_nonce(CHARS_ASCII, 30)
         await ws.send_json(message, dumps=json_minify)
-        ws_logger.debug(f"Websocket[{self._idx}] sent: {message}")
+        ws_logger.debug("Websocket[%d] sent: %s", self._idx, message)
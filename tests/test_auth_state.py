@@ -0,0 +1,197 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from contextlib import asynccontextmanager
+from http.cookies import BaseCookie
+from pathlib import Path
+from time import monotonic
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+
+from src.auth.auth_state import _LOGGED_IN, _VALIDATION_TTL, _AuthState
+from src.config import ClientType
+
+
+class TestValidate(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.auth_state_path = Path(temp_dir.name) / "auth_state.json"
+        self.cookies_path = Path(temp_dir.name) / "cookies.jar"
+        for name, path in (
+            ("AUTH_STATE_PATH", self.auth_state_path),
+            ("COOKIES_PATH", self.cookies_path),
+        ):
+            path_patcher = patch(f"src.auth.auth_state.{name}", path)
+            path_patcher.start()
+            self.addCleanup(path_patcher.stop)
+        self.twitch = MagicMock()
+        self.twitch._client_type = ClientType.ANDROID_APP
+        self.auth_state = _AuthState(self.twitch)
+        self.auth_state.session_id = "session"
+        self.auth_state.device_id = "device"
+        self.auth_state._set_access_token("token")
+        self.auth_state.user_id = 12345
+        self.auth_state._flags = _LOGGED_IN
+
+    def _mock_session(self, *, status: int = 200):
+        """Mock the cookie jar and the token validation response."""
+        client_info = self.twitch._client_type
+        self.jar = aiohttp.CookieJar()
+        self.jar.update_cookies({"auth-token": "token"}, client_info.CLIENT_URL)
+        self.twitch.get_session = AsyncMock(return_value=MagicMock(cookie_jar=self.jar))
+        response = MagicMock(status=status)
+        response.json = AsyncMock(
+            return_value={"client_id": client_info.CLIENT_ID, "user_id": "12345"}
+        )
+
+        @asynccontextmanager
+        async def request(*args, **kwargs):
+            yield response
+
+        self.twitch.request = request
+
+    async def test_recently_validated_state_skips_validation(self):
+        self.auth_state._last_validated = monotonic()
+        with patch.object(_AuthState, "_validate", new_callable=AsyncMock) as validate:
+            self.assertIs(await self.auth_state.validate(), self.auth_state)
+        validate.assert_not_awaited()
+
+    async def test_stale_validation_is_redone(self):
+        self.auth_state._last_validated = monotonic() - _VALIDATION_TTL
+        with patch.object(_AuthState, "_validate", new_callable=AsyncMock) as validate:
+            await self.auth_state.validate()
+        validate.assert_awaited_once()
+
+    async def test_revalidation_leaves_the_login_status_alone(self):
+        self._mock_session()
+        self.auth_state._last_validated = monotonic() - _VALIDATION_TTL
+        await self.auth_state.validate()
+        self.assertTrue(self.auth_state._is_validated())
+        self.twitch.gui.login.update.assert_not_called()
+        # the token hasn't changed, so the cookies are left to be saved on shutdown
+        self.assertFalse(self.cookies_path.exists())
+        self.assertTrue(self.auth_state_path.exists())
+
+    async def test_new_login_saves_the_cookies(self):
+        self._mock_session()
+        rejected = MagicMock(status=401)
+        accepted = MagicMock(status=200)
+        accepted.json = AsyncMock(
+            return_value={"client_id": ClientType.ANDROID_APP.CLIENT_ID, "user_id": "12345"}
+        )
+        responses = iter((rejected, accepted))
+
+        @asynccontextmanager
+        async def request(*args, **kwargs):
+            yield next(responses)
+
+        self.twitch.request = request
+
+        async def oauth_login(auth_state):
+            auth_state._set_access_token("new")
+            return auth_state.access_token
+
+        self.auth_state._last_validated = monotonic() - _VALIDATION_TTL
+        with patch.object(_AuthState, "_oauth_login", oauth_login):
+            await self.auth_state.validate()
+        saved = aiohttp.CookieJar()
+        saved.load(self.cookies_path)
+        cookie = saved.filter_cookies(ClientType.ANDROID_APP.CLIENT_URL)
+        self.assertEqual(cookie["auth-token"].value, "new")
+
+    async def test_invalidated_token_is_revalidated(self):
+        self.auth_state._last_validated = monotonic()
+        self.auth_state.invalidate()
+        with patch.object(_AuthState, "_validate", new_callable=AsyncMock) as validate:
+            await self.auth_state.validate()
+        validate.assert_awaited_once()
+
+    async def test_concurrent_callers_share_one_validation(self):
+        self.auth_state._last_validated = monotonic() - _VALIDATION_TTL
+
+        async def validate():
+            await asyncio.sleep(0.01)
+            self.auth_state._last_validated = monotonic()
+
+        with patch.object(_AuthState, "_validate", side_effect=validate) as validate_mock:
+            await asyncio.gather(self.auth_state.validate(), self.auth_state.validate())
+        validate_mock.assert_called_once()
+
+    async def test_saved_state_is_restored(self):
+        self.auth_state._last_validated = monotonic()
+        await self.auth_state._save()
+        self.assertEqual(os.stat(self.auth_state_path).st_mode & 0o777, 0o600)
+        self._mock_session()
+        self.twitch.request = MagicMock(side_effect=AssertionError("unexpected request"))
+        restored = _AuthState(self.twitch)
+        self.assertFalse(restored._flags)
+        await restored.validate()
+        self.assertTrue(restored._is_validated())
+        self.assertEqual(restored.access_token, "token")
+        self.assertEqual(restored.user_id, 12345)
+        self.assertEqual(restored.device_id, "device")
+        self.twitch.gui.login.update.assert_called_once()
+
+    async def test_unusable_saved_state_is_removed(self):
+        self._mock_session()
+        cookie = self.jar.filter_cookies(ClientType.ANDROID_APP.CLIENT_URL)
+        cases = {
+            "stale": (monotonic() - _VALIDATION_TTL, ClientType.ANDROID_APP, cookie),
+            "other client": (monotonic(), ClientType.WEB, cookie),
+            "cookie removed": (monotonic(), ClientType.ANDROID_APP, BaseCookie()),
+        }
+        for case, (last_validated, client_type, case_cookie) in cases.items():
+            with self.subTest(case):
+                self.auth_state._last_validated = last_validated
+                await self.auth_state._save()
+                self.twitch._client_type = client_type
+                restored = _AuthState(self.twitch)
+                await restored._load_saved(case_cookie)
+                self.twitch._client_type = ClientType.ANDROID_APP
+                self.assertFalse(restored._flags)
+                self.assertFalse(self.auth_state_path.exists())
+
+    async def test_saved_state_for_another_token_is_removed(self):
+        self._mock_session()
+        self.auth_state._last_validated = monotonic()
+        self.auth_state._set_access_token("other")
+        await self.auth_state._save()
+        restored = _AuthState(self.twitch)
+        await restored._load_saved(self.jar.filter_cookies(ClientType.ANDROID_APP.CLIENT_URL))
+        self.assertFalse(restored._flags)
+        self.assertFalse(self.auth_state_path.exists())
+
+    async def test_invalidate_removes_saved_state(self):
+        self.auth_state._last_validated = monotonic()
+        await self.auth_state._save()
+        self.auth_state.invalidate()
+        self.assertFalse(self.auth_state_path.exists())
+
+
+class TestHeaders(unittest.TestCase):
+    def setUp(self):
+        twitch = MagicMock()
+        twitch._client_type = ClientType.ANDROID_APP
+        self.auth_state = _AuthState(twitch)
+        self.auth_state._set_access_token("token")
+
+    def test_gql_headers_carry_the_content_type_and_token(self):
+        headers = self.auth_state.headers(user_agent="agent", gql=True)
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(headers["Authorization"], "OAuth token")
+        self.assertIs(self.auth_state.headers(user_agent="agent", gql=True), headers)
+
+    def test_token_change_rebuilds_the_headers(self):
+        headers = self.auth_state.headers(user_agent="agent", gql=True)
+        self.auth_state._set_access_token("other")
+        self.assertEqual(
+            self.auth_state.headers(user_agent="agent", gql=True)["Authorization"], "OAuth other"
+        )
+        self.assertEqual(headers["Authorization"], "OAuth token")
+
+
+if __name__ == "__main__":
+    unittest.main()
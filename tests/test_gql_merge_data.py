@@ -0,0 +1,43 @@
+import unittest
+
+from src.api.gql_client import GQLClient
+from src.exceptions import MinerException
+
+
+class TestGQLMergeData(unittest.TestCase):
+    def test_primary_values_take_precedence(self):
+        merged = GQLClient.merge_data({"a": 1, "b": None}, {"a": 2, "b": None, "c": 3})
+        self.assertEqual(merged, {"a": 1, "b": None, "c": 3})
+
+    def test_nested_dicts_are_merged(self):
+        primary = {"campaign": {"id": "1", "game": {"name": "Game"}}, "only_primary": {"x": 1}}
+        secondary = {"campaign": {"id": "2", "game": {"slug": "game"}, "status": "ACTIVE"}}
+        merged = GQLClient.merge_data(primary, secondary)
+        self.assertEqual(
+            merged,
+            {
+                "campaign": {
+                    "id": "1",
+                    "game": {"name": "Game", "slug": "game"},
+                    "status": "ACTIVE",
+                },
+                "only_primary": {"x": 1},
+            },
+        )
+
+    def test_inputs_are_not_modified(self):
+        primary = {"campaign": {"id": "1"}}
+        secondary = {"campaign": {"status": "ACTIVE"}, "extra": True}
+        GQLClient.merge_data(primary, secondary)
+        self.assertEqual(primary, {"campaign": {"id": "1"}})
+        self.assertEqual(secondary, {"campaign": {"status": "ACTIVE"}, "extra": True})
+
+    def test_inconsistent_types_raise(self):
+        with self.assertRaises(MinerException):
+            GQLClient.merge_data({"a": {"b": 1}}, {"a": [1]})
+        with self.assertRaises(MinerException):
+            GQLClient.merge_data({"a": {"b": 1}}, {"a": {"b": "1"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
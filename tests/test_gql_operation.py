@@ -0,0 +1,34 @@
+import unittest
+
+from src.config.constants import GQLOperation
+
+
+class TestGQLOperationWithVariables(unittest.TestCase):
+    def test_nested_variables_are_merged_without_modifying_the_base(self):
+        base = GQLOperation("Op", "hash", variables={"input": {"id": ..., "limit": 10}})
+        modified = base.with_variables({"input": {"id": "1"}})
+        self.assertIsInstance(modified, GQLOperation)
+        self.assertEqual(modified["operationName"], "Op")
+        self.assertEqual(modified["extensions"], base["extensions"])
+        self.assertEqual(modified["variables"], {"input": {"id": "1", "limit": 10}})
+        self.assertEqual(base["variables"], {"input": {"id": ..., "limit": 10}})
+
+    def test_variables_are_added_when_missing(self):
+        base = GQLOperation("Op", "hash")
+        modified = base.with_variables({"id": "1"})
+        self.assertEqual(modified["variables"], {"id": "1"})
+        self.assertNotIn("variables", base)
+
+    def test_unspecified_variable_raises(self):
+        base = GQLOperation("Op", "hash", variables={"id": ..., "limit": 10})
+        with self.assertRaises(RuntimeError):
+            base.with_variables({"limit": 5})
+
+    def test_unspecified_nested_variable_raises(self):
+        base = GQLOperation("Op", "hash", variables={"input": {"id": ..., "limit": 10}})
+        with self.assertRaises(RuntimeError):
+            base.with_variables({"input": {"limit": 5}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from src.api.gql_client import GQLClient
+from src.exceptions import GQLException
+
+
+def _make_client(*responses, statuses: tuple[int, ...] = ()) -> GQLClient:
+    http_client = MagicMock()
+    http_client.backoff_sleep = AsyncMock()
+    response_iter = iter(responses)
+    status_iter = iter(statuses)
+
+    @asynccontextmanager
+    async def request(*args, **kwargs):
+        response = MagicMock(status=next(status_iter, 200))
+        response.json = AsyncMock(return_value=next(response_iter))
+        yield response
+
+    http_client.request = request
+    auth_state = MagicMock()
+    auth_state.headers.return_value = {}
+    auth_state.validate = AsyncMock(return_value=auth_state)
+    return GQLClient(http_client, auth_state, MagicMock())
+
+
+class TestGQLRequestErrors(unittest.IsolatedAsyncioTestCase):
+    async def test_server_error_nullifies_the_error_path(self):
+        client = _make_client(
+            {
+                "data": {"user": {"campaign": {"id": "1"}, "name": "user"}},
+                "errors": [{"message": "server error", "path": ["user", "campaign"]}],
+            }
+        )
+        response = await client.request({"operationName": "Campaign"})
+        self.assertEqual(response["data"], {"user": {"campaign": None, "name": "user"}})
+
+    async def test_timeout_errors_are_retried(self):
+        client = _make_client(
+            {"data": None, "errors": [{"message": "service timeout"}]},
+            {"data": {"ok": True}},
+        )
+        response = await client.request({"operationName": "Campaign"})
+        self.assertEqual(response, {"data": {"ok": True}})
+        client.http_client.backoff_sleep.assert_awaited_once()
+
+    async def test_batched_responses_are_checked_individually(self):
+        client = _make_client(
+            [{"data": {"ok": True}}, {"data": None, "errors": [{"message": "service timeout"}]}],
+            [{"data": {"ok": True}}, {"data": {"ok": True}}],
+        )
+        response = await client.request([{"operationName": "A"}, {"operationName": "B"}])
+        self.assertEqual(response, [{"data": {"ok": True}}, {"data": {"ok": True}}])
+        client.http_client.backoff_sleep.assert_awaited_once()
+
+    async def test_service_error_is_retried_only_once(self):
+        error_response = {
+            "data": None,
+            "errors": [{"message": "service error"}],
+            "extensions": {"operationName": "Campaign"},
+        }
+        client = _make_client(error_response, error_response)
+        with self.assertRaises(GQLException):
+            await client.request({"operationName": "Campaign"})
+        client.http_client.backoff_sleep.assert_awaited_once_with(5)
+
+    async def test_rejected_token_is_revalidated_once(self):
+        unauthorized = {"error": "Unauthorized", "status": 401, "message": "invalid token"}
+        client = _make_client(unauthorized, {"data": {"ok": True}}, statuses=(401, 200))
+        response = await client.request({"operationName": "Campaign"})
+        self.assertEqual(response, {"data": {"ok": True}})
+        client._auth_state.invalidate.assert_called_once()
+        self.assertEqual(client._auth_state.validate.await_count, 2)
+
+        client = _make_client(unauthorized, unauthorized, statuses=(401, 401))
+        with self.assertRaises(GQLException):
+            await client.request({"operationName": "Campaign"})
+        client._auth_state.invalidate.assert_called_once()
+
+    async def test_unknown_errors_raise(self):
+        client = _make_client({"data": None, "errors": [{"message": "something else"}]})
+        with self.assertRaises(GQLException):
+            await client.request({"operationName": "Campaign"})
+
+
+if __name__ == "__main__":
+    unittest.main()
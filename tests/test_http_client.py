@@ -0,0 +1,139 @@
+import asyncio
+import tempfile
+import unittest
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+from yarl import URL
+
+from src.api.http_client import HTTPClient, save_cookie_jar
+from src.exceptions import ExitRequest, RequestInvalid
+
+
+class TestBackoffSleep(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.twitch = MagicMock()
+        self.twitch._exit_event = asyncio.Event()
+        self.http_client = HTTPClient(MagicMock(), MagicMock(), self.twitch, MagicMock())
+
+    async def test_returns_after_delay(self):
+        await self.http_client.backoff_sleep(0.01)
+
+    async def test_exit_wakes_up_the_wait(self):
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, self.twitch._exit_event.set)
+        with self.assertRaises(ExitRequest):
+            # would otherwise block the test for a minute
+            await asyncio.wait_for(self.http_client.backoff_sleep(60), timeout=5)
+
+
+class TestGetSession(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_share_one_session(self):
+        http_client = HTTPClient(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        session = MagicMock(closed=False)
+
+        async def create_session():
+            await asyncio.sleep(0.01)
+            return session
+
+        http_client._create_session = AsyncMock(side_effect=create_session)
+        sessions = await asyncio.gather(http_client.get_session(), http_client.get_session())
+        self.assertEqual(sessions, [session, session])
+        http_client._create_session.assert_awaited_once()
+
+
+class TestSaveCookieJar(unittest.IsolatedAsyncioTestCase):
+    async def test_cookies_are_saved_as_they_were_when_called(self):
+        url = URL("https://www.twitch.tv")
+        cookie_jar = aiohttp.CookieJar()
+        cookie_jar.update_cookies({"auth-token": "token"}, url)
+
+        async def to_thread(func, *args):
+            # requests on the loop keep updating the jar while the write is pending
+            cookie_jar.update_cookies({"unique_id": "device"}, url)
+            return func(*args)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cookies.jar"
+            with patch("src.api.http_client.asyncio.to_thread", side_effect=to_thread):
+                await save_cookie_jar(cookie_jar, path)
+            loaded = aiohttp.CookieJar()
+            loaded.load(path)
+        cookie = loaded.filter_cookies(url)
+        self.assertEqual(cookie["auth-token"].value, "token")
+        self.assertNotIn("unique_id", cookie)
+
+
+class TestWarmup(unittest.IsolatedAsyncioTestCase):
+    async def test_session_creation_failure_is_ignored(self):
+        http_client = HTTPClient(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        http_client.get_session = AsyncMock(side_effect=OSError("cookies.jar unreadable"))
+        await http_client.warmup("https://gql.twitch.tv/gql")
+        http_client.get_session.assert_awaited_once()
+
+    async def test_connection_failure_is_ignored(self):
+        http_client = HTTPClient(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+        session = MagicMock()
+        session.head.side_effect = aiohttp.ClientConnectionError()
+        http_client.get_session = AsyncMock(return_value=session)
+        await http_client.warmup("https://gql.twitch.tv/gql")
+        session.head.assert_called_once()
+
+
+class TestRequestInvalidation(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.twitch = MagicMock()
+        self.twitch._exit_event = asyncio.Event()
+        settings = MagicMock()
+        settings.proxy = None
+        self.http_client = HTTPClient(settings, MagicMock(), self.twitch, MagicMock())
+        self.session = MagicMock()
+        self.http_client.get_session = AsyncMock(return_value=self.session)
+        self.http_client._session_timeout = 10.0
+
+    async def test_expired_request_is_not_sent(self):
+        # expires within the session timeout
+        invalidate_after = datetime.now(UTC) + timedelta(seconds=5)
+        with self.assertRaises(RequestInvalid):
+            async with self.http_client.request(
+                "GET", "https://example.com", invalidate_after=invalidate_after
+            ):
+                pass
+        self.session.request.assert_not_called()
+
+    async def test_server_errors_are_retried(self):
+        server_error = MagicMock(status=503)
+        ok = MagicMock(status=200)
+        ok.read = AsyncMock()
+        self.session.request = AsyncMock(side_effect=[server_error, ok])
+        self.http_client.backoff_sleep = AsyncMock()
+        async with self.http_client.request("GET", "https://example.com") as response:
+            self.assertIs(response, ok)
+        self.http_client.backoff_sleep.assert_awaited_once()
+        self.http_client.gui.print.assert_called_once()
+        server_error.release.assert_called_once()
+
+    async def test_caller_errors_are_not_retried(self):
+        ok = MagicMock(status=200)
+        self.session.request = AsyncMock(return_value=ok)
+        self.http_client.backoff_sleep = AsyncMock()
+        with self.assertRaises(aiohttp.ClientPayloadError):
+            async with self.http_client.request("GET", "https://example.com", prefetch=False):
+                raise aiohttp.ClientPayloadError()
+        self.session.request.assert_awaited_once()
+        self.http_client.backoff_sleep.assert_not_awaited()
+        ok.read.assert_not_called()
+        ok.release.assert_called_once()
+
+    async def test_exit_stops_the_request(self):
+        self.twitch._exit_event.set()
+        with self.assertRaises(ExitRequest):
+            async with self.http_client.request("GET", "https://example.com"):
+                pass
+        self.session.request.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
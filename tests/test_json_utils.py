@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from datetime import UTC, datetime
+from pathlib import Path
+
+from yarl import URL
+
+from src.utils import isonow, json_load, json_save
+
+
+class TestJsonSaveLoad(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmpdir.name) / "data.json"
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_round_trip_preserves_special_types(self):
+        contents = {
+            "when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+            "url": URL("https://www.twitch.tv"),
+            "tags": {"a"},
+            "name": "Čeština",
+        }
+
+        json_save(self.path, contents)
+        loaded = json_load(self.path, contents)
+
+        self.assertEqual(loaded, contents)
+
+    def test_save_sorts_keys_when_requested(self):
+        json_save(self.path, {"b": 1, "a": 2}, sort=True)
+
+        self.assertLess(
+            self.path.read_text(encoding="utf8").index('"a"'),
+            self.path.read_text(encoding="utf8").index('"b"'),
+        )
+
+    def test_save_skips_unchanged_contents(self):
+        json_save(self.path, {"key": "value"})
+        os.utime(self.path, ns=(0, 0))
+
+        json_save(self.path, {"key": "value"})
+        self.assertEqual(self.path.stat().st_mtime_ns, 0)
+
+        json_save(self.path, {"key": "other"})
+        self.assertNotEqual(self.path.stat().st_mtime_ns, 0)
+        self.assertEqual(json_load(self.path, {"key": ""}), {"key": "other"})
+
+    def test_save_replaces_file_without_leftovers(self):
+        json_save(self.path, {"key": "value"})
+        json_save(self.path, {"key": "other"})
+
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+    def test_load_missing_file_returns_defaults(self):
+        defaults = {"key": "value"}
+
+        self.assertEqual(json_load(self.path, defaults), defaults)
+
+    def test_load_merges_with_defaults(self):
+        json_save(self.path, {"stale": True, "key": 1})
+
+        loaded = json_load(self.path, {"key": 0, "new": "x"})
+
+        self.assertEqual(loaded, {"key": 1, "new": "x"})
+
+
+class TestIsoNow(unittest.TestCase):
+    def test_format_matches_twitch_timestamps(self):
+        self.assertRegex(isonow(), r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$")
+
+    def test_matches_isoformat_output(self):
+        value = isonow()
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+        self.assertEqual(parsed.tzinfo, UTC)
+        self.assertEqual(parsed.isoformat(timespec="milliseconds").replace("+00:00", "Z"), value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
+import tempfile
 import unittest
-from unittest.mock import AsyncMock, MagicMock
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.config.settings import Settings
+from src.config.settings import Settings, default_settings
 from src.web.app import SettingsUpdate
 from src.web.managers.settings import SettingsManager
 
@@ -55,6 +57,42 @@ class TestSettingsAPI(unittest.IsolatedAsyncioTestCase):
         manager.update_settings({"games_to_watch": games})
         mock_callback.assert_called_once()
 
+    async def test_settings_manager_clamps_connection_quality(self):
+        mock_settings = MagicMock(spec=Settings)
+        mock_settings.connection_quality = 1
+        manager = SettingsManager(AsyncMock(), mock_settings, MagicMock())
+
+        manager.update_settings({"connection_quality": 10})
+        self.assertEqual(mock_settings.connection_quality, 6)
+        manager.update_settings({"connection_quality": 0})
+        self.assertEqual(mock_settings.connection_quality, 1)
+
+    async def test_settings_manager_saves_only_changes(self):
+        mock_settings = MagicMock(spec=Settings)
+        mock_settings.dark_mode = False
+        manager = SettingsManager(AsyncMock(), mock_settings, MagicMock())
+
+        manager.update_settings({"dark_mode": False})
+        mock_settings.save.assert_not_called()
+        manager.update_settings({"dark_mode": True})
+        mock_settings.save.assert_called_once()
+
+
+class TestSettingsLoad(unittest.TestCase):
+    def test_loaded_settings_do_not_share_defaults(self):
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            patch("src.config.settings.SETTINGS_PATH", Path(temp_dir) / "settings.json"),
+        ):
+            settings = Settings()
+        self.assertEqual(settings.inventory_filters, default_settings["inventory_filters"])
+        self.assertIsNot(settings.inventory_filters, default_settings["inventory_filters"])
+        self.assertIsNot(
+            settings.inventory_filters["game_name_search"],
+            default_settings["inventory_filters"]["game_name_search"],
+        )
+        self.assertIsNot(settings.games_to_watch, default_settings["games_to_watch"])
+
 
 if __name__ == "__main__":
     unittest.main()
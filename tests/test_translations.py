@@ -1,7 +1,7 @@
 import json
 
 from src.config import LANG_PATH
-from src.i18n.translator import GUISettings
+from src.i18n.translator import GUISettings, Translator
 
 
 def test_all_language_settings_include_gui_settings_schema_keys():
@@ -20,3 +20,15 @@ def test_all_language_settings_include_gui_settings_schema_keys():
 
     assert sorted(set(english_settings) - required_settings_keys) == []
     assert missing_by_language == {}
+
+
+def test_translator_loads_every_language_file():
+    expected = {
+        json.loads(filepath.read_text(encoding="utf-8"))["language_name"]
+        for filepath in LANG_PATH.glob("*.json")
+    }
+
+    translator = Translator()
+
+    assert set(translator.get_languages()) == expected
+    assert translator.get_languages() == sorted(expected)
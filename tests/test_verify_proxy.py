@@ -25,11 +25,15 @@ class TestVerifyProxy(unittest.TestCase):
         self.mock_session_cls = self.session_patcher.start()
         # session object itself is not async, it has async methods/CMs
         self.mock_session = MagicMock()
-        # Ensure the session context manager returns our mock session
-        # ClientSession() -> CM -> __aenter__ -> session
-        self.mock_session_cls.return_value.__aenter__.return_value = self.mock_session
+        self.mock_session.closed = False
+        # The shared session is created from ClientSession() directly
+        self.mock_session_cls.return_value = self.mock_session
+        # Start every test without a cached shared session
+        self.shared_session_patcher = patch("src.web.app._http_session", None)
+        self.shared_session_patcher.start()
 
     def tearDown(self):
+        self.shared_session_patcher.stop()
         self.session_patcher.stop()
 
     def test_verify_proxy_success(self):
@@ -81,6 +85,19 @@ class TestVerifyProxy(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertIn("Connection failed", result["message"])
 
+    def test_verify_proxy_reuses_shared_session(self):
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        self.mock_session.get.side_effect = lambda *args, **kwargs: MockResponseContext(
+            mock_response
+        )
+
+        asyncio.run(verify_proxy(ProxyVerifyRequest(proxy="http://valid-proxy:8080")))
+        asyncio.run(verify_proxy(ProxyVerifyRequest(proxy="http://other-proxy:8080")))
+
+        self.mock_session_cls.assert_called_once_with()
+        self.assertEqual(self.mock_session.get.call_count, 2)
+
     def test_verify_proxy_empty(self):
         request = ProxyVerifyRequest(proxy="")
         result = asyncio.run(verify_proxy(request))
@@ -1789,7 +1789,7 @@ function applyTranslations(t) {
             ];
             const notesItems = t.gui.help.important_notes_items || [
                 'Do not watch streams on the same account while mining',
-                'Keep your cookies.jar file secure',
+                'Keep your cookies.jar and auth_state.json files secure',
                 'Requires linked game accounts for drops'
             ];
 